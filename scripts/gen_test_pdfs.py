@@ -0,0 +1,149 @@
+"""Generate the PDF files used by the test suite.
+
+The test fixtures read these files from tests/data/ instead of building
+them with pymupdf on every run. Run this script from the repository root
+after changing any of them and commit the regenerated files:
+
+    python scripts/gen_test_pdfs.py
+
+Output is deterministic for a given pymupdf version, except for
+protected.pdf: AES encryption uses a fresh random key and IVs on every
+run, so that file changes each time the script is run.
+"""
+
+from collections.abc import Callable
+from contextlib import closing
+from pathlib import Path
+
+import fitz  # pymupdf
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "tests" / "data"
+
+
+def add_sample_pages(doc: fitz.Document) -> None:
+    """Add a page with some text."""
+    page = doc.new_page()
+    text_point = fitz.Point(72, 72)
+    page.insert_text(text_point, "Hello, World!", fontsize=12)
+    page.insert_text(fitz.Point(72, 100), "This is a test PDF document.", fontsize=12)
+
+
+def add_multi_pages(doc: fitz.Document) -> None:
+    """Add three pages with two lines of text each."""
+    for i in range(3):
+        page = doc.new_page()
+        page.insert_text(fitz.Point(72, 72), f"Page {i + 1} content", fontsize=12)
+        page.insert_text(
+            fitz.Point(72, 100), f"More text on page {i + 1}.", fontsize=12
+        )
+
+
+def add_large_pages(doc: fitz.Document) -> None:
+    """Add enough pages to split across extraction workers."""
+    for i in range(25):
+        page = doc.new_page()
+        page.insert_text(fitz.Point(72, 72), f"Page {i + 1} content", fontsize=12)
+
+
+def add_heading_pages(doc: fitz.Document) -> None:
+    """Add a page with headings and paragraphs in different font sizes."""
+    page = doc.new_page()
+
+    # Title - largest font
+    page.insert_text(fitz.Point(72, 72), "Document Title", fontsize=24)
+
+    # Heading 1
+    page.insert_text(fitz.Point(72, 120), "Chapter One", fontsize=18)
+
+    # Regular paragraph
+    page.insert_text(
+        fitz.Point(72, 150), "This is regular paragraph text.", fontsize=12
+    )
+
+    # Heading 2
+    page.insert_text(fitz.Point(72, 180), "Section 1.1", fontsize=14)
+
+    # More paragraph text
+    page.insert_text(fitz.Point(72, 210), "Another paragraph here.", fontsize=12)
+
+
+def add_list_pages(doc: fitz.Document) -> None:
+    """Add a page with a bullet list and a numbered list."""
+    page = doc.new_page()
+
+    lines = [
+        "Here is a bullet list:",
+        "- First item",
+        "- Second item",
+        "- Third item",
+        "Here is a numbered list:",
+        "1. First numbered item",
+        "2. Second numbered item",
+        "3. Third numbered item",
+    ]
+    # All lines share one font size, so insert them in a single call
+    page.insert_textbox(fitz.Rect(72, 60, 500, 400), "\n".join(lines), fontsize=12)
+
+
+def add_protected_pages(doc: fitz.Document) -> None:
+    """Add a page of content for the encrypted PDF."""
+    page = doc.new_page()
+    page.insert_text(fitz.Point(72, 72), "Secret content", fontsize=12)
+
+
+def add_blank_page(doc: fitz.Document) -> None:
+    """Add one blank page."""
+    doc.new_page()
+
+
+# Output file name -> function adding its pages to an empty document
+PDF_BUILDERS: dict[str, Callable[[fitz.Document], None]] = {
+    "sample.pdf": add_sample_pages,
+    "multi_page.pdf": add_multi_pages,
+    "large.pdf": add_large_pages,
+    "headings.pdf": add_heading_pages,
+    "lists.pdf": add_list_pages,
+    "protected.pdf": add_protected_pages,
+    "empty.pdf": add_blank_page,
+}
+
+# Extra serialization options per output file
+PDF_OPTIONS: dict[str, dict[str, object]] = {
+    "protected.pdf": {
+        "encryption": fitz.PDF_ENCRYPT_AES_256,
+        "user_pw": "user123",
+        "owner_pw": "owner456",
+    },
+}
+
+
+def build_pdf(add_pages: Callable[[fitz.Document], None], **options: object) -> bytes:
+    """Build a PDF in memory.
+
+    Args:
+        add_pages: Function adding pages to an empty document.
+        **options: Extra options for fitz.Document.tobytes.
+
+    Returns:
+        The serialized PDF.
+    """
+    with closing(fitz.open()) as doc:
+        add_pages(doc)
+        # no_new_id keeps the random trailer /ID out of the output
+        return doc.tobytes(
+            garbage=0, deflate=False, clean=False, no_new_id=True, **options
+        )
+
+
+def main() -> None:
+    """Write every test PDF to tests/data/."""
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+    for name, add_pages in PDF_BUILDERS.items():
+        pdf_path = DATA_DIR / name
+        pdf_path.write_bytes(build_pdf(add_pages, **PDF_OPTIONS.get(name, {})))
+        print(f"Wrote {pdf_path}")
+
+
+if __name__ == "__main__":
+    main()
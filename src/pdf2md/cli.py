@@ -3,6 +3,9 @@
 This module provides the CLI using typer with rich output formatting.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Annotated
 
@@ -11,7 +14,8 @@ from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from pdf2md import __version__
-from pdf2md.converter import PDFToMarkdownConverter
+from pdf2md.converter import ConversionResult, PDFToMarkdownConverter
+from pdf2md.utils.cache import default_cache_dir
 
 app = typer.Typer(
     name="pdf2md",
@@ -30,19 +34,127 @@ def version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
+def _convert_file(
+    input_path: Path,
+    output_path: Path,
+    force: bool,
+    cache_dir: Path | None,
+    detect_headings: bool,
+) -> ConversionResult:
+    """Convert a single PDF file for a directory conversion.
+
+    Defined at module level so it can be run in worker processes. Files are
+    already converted in parallel, so each one is extracted serially.
+    """
+    converter = PDFToMarkdownConverter(
+        input_path,
+        output_path,
+        force=force,
+        cache_dir=cache_dir,
+        detect_headings=detect_headings,
+        parallel=False,
+    )
+    return converter.convert()
+
+
+def _convert_directory(
+    input_dir: Path,
+    output_dir: Path,
+    *,
+    force: bool,
+    quiet: bool,
+    cache_dir: Path | None,
+    detect_headings: bool,
+    jobs: int | None,
+) -> int:
+    """Convert every PDF file in a directory.
+
+    Each file is converted independently, so conversions are spread across
+    worker processes with no shared state.
+
+    Args:
+        input_dir: Directory containing the PDF files to convert.
+        output_dir: Directory to write the Markdown files to.
+        force: Whether to overwrite existing output files.
+        quiet: Whether to suppress output except errors.
+        cache_dir: Conversion cache directory, or None to disable caching.
+        detect_headings: Whether to detect headings from font sizes.
+        jobs: Number of worker processes, or None for one per CPU.
+
+    Returns:
+        The highest exit code of all conversions (0 if all succeeded).
+    """
+    pdf_files = sorted(
+        path
+        for path in input_dir.iterdir()
+        if path.suffix.lower() == ".pdf" and path.is_file()
+    )
+    if not pdf_files:
+        error_console.print(
+            f"[red]Error:[/red] No PDF files found in directory: {input_dir}"
+        )
+        return 1
+
+    output_files = [output_dir / path.with_suffix(".md").name for path in pdf_files]
+    workers = min(jobs or os.cpu_count() or 1, len(pdf_files))
+    args = (
+        pdf_files,
+        output_files,
+        repeat(force),
+        repeat(cache_dir),
+        repeat(detect_headings),
+    )
+
+    # A single worker converts in this process rather than paying for a pool
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    exit_code = 0
+    converted = 0
+    try:
+        results = (
+            executor.map(_convert_file, *args)
+            if executor
+            else map(_convert_file, *args)
+        )
+        for pdf_file, output_file, result in zip(
+            pdf_files, output_files, results, strict=True
+        ):
+            if result.success:
+                converted += 1
+                if not quiet:
+                    source = " (from cache)" if result.from_cache else ""
+                    console.print(
+                        f"[green]Converted[/green] {pdf_file} -> {output_file}{source}"
+                    )
+            else:
+                error_console.print(
+                    f"[red]Error:[/red] {pdf_file}: {result.error_message}"
+                )
+                exit_code = max(exit_code, result.exit_code)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    if not quiet:
+        summary = f"Converted {converted} of {len(pdf_files)} file(s)"
+        console.print(
+            f"[green]Success![/green] {summary}" if not exit_code else summary
+        )
+    return exit_code
+
+
 @app.command()
 def main(
     input_file: Annotated[
         Path,
         typer.Argument(
-            help="Path to the input PDF file.",
+            help="Path to the input PDF file, or a directory of PDF files.",
             exists=False,  # We handle existence check ourselves for better error messages
         ),
     ],
     output_file: Annotated[
         Path | None,
         typer.Argument(
-            help="Path for the output Markdown file. Defaults to input filename with .md extension.",
+            help="Path for the output Markdown file (or directory, for a directory input). Defaults to input filename with .md extension.",
         ),
     ] = None,
     force: Annotated[
@@ -69,6 +181,29 @@ def main(
             help="Suppress output except errors.",
         ),
     ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="Always convert, ignoring and not updating the conversion cache.",
+        ),
+    ] = False,
+    no_headings: Annotated[
+        bool,
+        typer.Option(
+            "--no-headings",
+            help="Skip heading detection for much faster extraction; headings are output as plain paragraphs.",
+        ),
+    ] = False,
+    jobs: Annotated[
+        int | None,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=1,
+            help="Number of worker processes for a directory input. Defaults to the CPU count.",
+        ),
+    ] = None,
     version: Annotated[
         bool | None,
         typer.Option(
@@ -84,6 +219,9 @@ def main(
     The converter extracts text from the PDF, detects document structure
     (headings, lists, paragraphs), and outputs properly formatted Markdown.
 
+    If INPUT_FILE is a directory, every PDF file in it is converted in
+    parallel and the exit code is the highest of the individual conversions.
+
     Exit Codes:
         0: Success
         1: Input file not found
@@ -92,6 +230,27 @@ def main(
         4: Output write error
         5: Unexpected error
     """
+    cache_dir = None if no_cache else default_cache_dir()
+
+    # Convert a whole directory of PDFs
+    if input_file.is_dir():
+        output_dir = input_file if output_file is None else output_file
+        if not quiet and verbose:
+            console.print(f"[bold]pdf2md[/bold] version {__version__}")
+            console.print(f"Input:  {input_file}")
+            console.print(f"Output: {output_dir}")
+            console.print()
+        exit_code = _convert_directory(
+            input_file,
+            output_dir,
+            force=force,
+            quiet=quiet,
+            cache_dir=cache_dir,
+            detect_headings=not no_headings,
+            jobs=jobs,
+        )
+        raise typer.Exit(exit_code)
+
     # Determine output path
     if output_file is None:
         output_file = input_file.with_suffix(".md")
@@ -105,7 +264,13 @@ def main(
             console.print()
 
     # Create converter and run
-    converter = PDFToMarkdownConverter(input_file, output_file, force=force)
+    converter = PDFToMarkdownConverter(
+        input_file,
+        output_file,
+        force=force,
+        cache_dir=cache_dir,
+        detect_headings=not no_headings,
+    )
 
     if not quiet:
         with Progress(
@@ -122,8 +287,9 @@ def main(
     # Handle result
     if result.success:
         if not quiet:
+            source = " (from cache)" if result.from_cache else ""
             console.print(
-                f"[green]Success![/green] Converted {result.pages_converted} page(s) to {output_file}"
+                f"[green]Success![/green] Converted {result.pages_converted} page(s) to {output_file}{source}"
             )
         raise typer.Exit(0)
     else:
@@ -4,18 +4,27 @@ This module provides the main conversion pipeline that coordinates
 text extraction, structure detection, and markdown formatting.
 """
 
+import os
+import shutil
+import tempfile
+from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import Path
 
 from pdf2md.extractors.structure import StructureExtractor
 from pdf2md.extractors.text import TextExtractor
 from pdf2md.formatters.markdown import MarkdownFormatter
+from pdf2md.utils.cache import ConversionCache
 from pdf2md.utils.validation import (
     ValidationError,
-    validate_input_file,
+    open_input_file,
     validate_output_path,
 )
 
+# Output buffer size in bytes; many small element writes are coalesced into
+# few large writes to the file descriptor
+OUTPUT_BUFFER_SIZE = 1 << 20
+
 
 @dataclass
 class ConversionResult:
@@ -27,6 +36,7 @@ class ConversionResult:
         output_path: Path to the output file (if successful).
         pages_converted: Number of pages converted (if successful).
         error_message: Error message (if failed).
+        from_cache: Whether the output was copied from the conversion cache.
     """
 
     success: bool
@@ -34,13 +44,15 @@ class ConversionResult:
     output_path: Path | None = None
     pages_converted: int = 0
     error_message: str | None = None
+    from_cache: bool = False
 
 
 class PDFToMarkdownConverter:
     """Orchestrates the PDF to Markdown conversion pipeline.
 
     This class coordinates the extraction, structure detection, and
-    formatting stages to convert a PDF file to Markdown.
+    formatting stages to convert a PDF file to Markdown. Structure detection
+    and formatting are streamed page by page into the output file.
     """
 
     def __init__(
@@ -48,6 +60,9 @@ class PDFToMarkdownConverter:
         input_path: str | Path,
         output_path: str | Path,
         force: bool = False,
+        cache_dir: str | Path | None = None,
+        detect_headings: bool = True,
+        parallel: bool = True,
     ) -> None:
         """Initialize the converter.
 
@@ -55,10 +70,21 @@ class PDFToMarkdownConverter:
             input_path: Path to the input PDF file.
             output_path: Path for the output Markdown file.
             force: If True, overwrite existing output file.
+            cache_dir: Directory for the conversion cache. If None, caching
+                is disabled.
+            detect_headings: If False, skip the per-span font extraction
+                that heading detection needs. Extraction is much faster, and
+                headings are output as plain paragraphs.
+            parallel: If True, extract large documents in worker processes.
+                Callers that already run conversions in parallel should pass
+                False to avoid nested worker pools.
         """
         self.input_path = Path(input_path) if isinstance(input_path, str) else input_path
         self.output_path = Path(output_path) if isinstance(output_path, str) else output_path
         self.force = force
+        self.cache = ConversionCache(cache_dir) if cache_dir is not None else None
+        self.detect_headings = detect_headings
+        self.parallel = parallel
 
     def convert(self) -> ConversionResult:
         """Execute the PDF to Markdown conversion.
@@ -66,9 +92,9 @@ class PDFToMarkdownConverter:
         Returns:
             ConversionResult with success status and details.
         """
-        # Validate input file
+        # Validate input file, keeping the document open for extraction
         try:
-            validate_input_file(self.input_path)
+            doc = open_input_file(self.input_path)
         except ValidationError as e:
             return ConversionResult(
                 success=False,
@@ -80,15 +106,44 @@ class PDFToMarkdownConverter:
         try:
             validate_output_path(self.output_path, force=self.force)
         except ValidationError as e:
+            doc.close()
             return ConversionResult(
                 success=False,
                 exit_code=e.exit_code,
                 error_message=str(e),
             )
 
+        # Reuse a previous conversion of the same PDF if one is cached
+        cache_key = self._cache_key()
+        if self.cache is not None and cache_key is not None:
+            cached_path = self.cache.lookup(cache_key, self.input_path)
+            if cached_path is not None:
+                page_count = doc.page_count
+                doc.close()
+                try:
+                    shutil.copyfile(cached_path, self.output_path)
+                except Exception as e:
+                    return ConversionResult(
+                        success=False,
+                        exit_code=4,
+                        error_message=f"Error writing output file: {e}",
+                    )
+                return ConversionResult(
+                    success=True,
+                    exit_code=0,
+                    output_path=self.output_path,
+                    pages_converted=page_count,
+                    from_cache=True,
+                )
+
         # Extract text from PDF
         try:
-            text_extractor = TextExtractor(self.input_path)
+            text_extractor = TextExtractor(
+                self.input_path,
+                parallel=self.parallel,
+                detailed=self.detect_headings,
+                doc=doc,
+            )
             pages = text_extractor.extract()
         except Exception as e:
             return ConversionResult(
@@ -96,38 +151,56 @@ class PDFToMarkdownConverter:
                 exit_code=5,
                 error_message=f"Error extracting text: {e}",
             )
+        finally:
+            doc.close()
 
-        # Detect structure
+        # Write to a temporary file next to the output and rename it into
+        # place on success, so a failed conversion never truncates or removes
+        # an existing output file. Markdown is written with "\n" line endings
+        # on every platform, which also skips newline translation on each write.
         try:
-            structure_extractor = StructureExtractor(pages)
-            structured_pages = structure_extractor.extract()
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.output_path.parent,
+                prefix=f".{self.output_path.name}.",
+                suffix=".tmp",
+            )
+            output = os.fdopen(
+                fd, "w", encoding="utf-8", newline="\n", buffering=OUTPUT_BUFFER_SIZE
+            )
         except Exception as e:
             return ConversionResult(
                 success=False,
-                exit_code=5,
-                error_message=f"Error detecting structure: {e}",
+                exit_code=4,
+                error_message=f"Error writing output file: {e}",
             )
 
-        # Format as Markdown
+        # Detect structure and format page by page, streaming the Markdown
+        # straight into the temporary file
         try:
-            formatter = MarkdownFormatter(structured_pages)
-            markdown_content = formatter.format()
+            with output:
+                structure_extractor = StructureExtractor(pages)
+                formatter = MarkdownFormatter(structure_extractor.iter_extract())
+                formatter.write(output)
+            os.chmod(tmp_name, _new_file_mode())
+            os.replace(tmp_name, self.output_path)
         except Exception as e:
+            Path(tmp_name).unlink(missing_ok=True)
+            if isinstance(e, OSError):
+                return ConversionResult(
+                    success=False,
+                    exit_code=4,
+                    error_message=f"Error writing output file: {e}",
+                )
             return ConversionResult(
                 success=False,
                 exit_code=5,
-                error_message=f"Error formatting markdown: {e}",
+                error_message=f"Error converting to markdown: {e}",
             )
 
-        # Write output file
-        try:
-            self.output_path.write_text(markdown_content, encoding="utf-8")
-        except Exception as e:
-            return ConversionResult(
-                success=False,
-                exit_code=4,
-                error_message=f"Error writing output file: {e}",
-            )
+        # A failure to populate the cache should not fail the conversion
+        if self.cache is not None and cache_key is not None:
+            with suppress(OSError):
+                self.cache.store(cache_key, self.output_path)
 
         return ConversionResult(
             success=True,
@@ -135,3 +208,30 @@ class PDFToMarkdownConverter:
             output_path=self.output_path,
             pages_converted=len(pages),
         )
+
+    def _cache_key(self) -> str | None:
+        """Compute the cache key for the input file.
+
+        Returns:
+            The cache key, or None if caching is disabled or the input
+            cannot be hashed.
+        """
+        if self.cache is None:
+            return None
+        try:
+            key = self.cache.key_for(self.input_path)
+        except OSError:
+            return None
+        # Output without headings must not be served for a full conversion
+        return key if self.detect_headings else f"{key}-no-headings"
+
+
+def _new_file_mode() -> int:
+    """Return the permissions open() would give a new file.
+
+    mkstemp creates files readable only by their owner; the output file
+    should get the usual permissions under the current umask instead.
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
@@ -4,9 +4,12 @@ This module provides utilities to detect document structure including
 headings and lists based on font sizes and text patterns.
 """
 
-import re
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Iterator
 from dataclasses import dataclass
 from enum import Enum
+from itertools import chain
 
 from pdf2md.extractors.text import PageContent, TextBlock
 
@@ -25,7 +28,7 @@ class ElementType(Enum):
     NUMBERED_LIST_ITEM = "numbered_list_item"
 
 
-@dataclass
+@dataclass(slots=True)
 class StructuredElement:
     """Represents a structural element detected in the document.
 
@@ -40,9 +43,40 @@ class StructuredElement:
     level: int = 0
 
 
-# Regex patterns for list detection
-BULLET_PATTERN = re.compile(r"^\s*[-*+]\s+(.+)$")
-NUMBERED_PATTERN = re.compile(r"^\s*(\d+)[.)]\s+(.+)$")
+# Characters that can start a bullet list item; numbered items start with a digit
+_BULLET_CHARS = frozenset("-*+")
+
+
+def _match_bullet(line: str) -> str | None:
+    """Match a bullet list item such as ``- item``.
+
+    Args:
+        line: A stripped, non-empty line of text.
+
+    Returns:
+        The item text without its marker, or None if not a bullet item.
+    """
+    if line[0] in _BULLET_CHARS and line[1:2].isspace():
+        return line[2:].lstrip()
+    return None
+
+
+def _match_numbered(line: str) -> str | None:
+    """Match a numbered list item such as ``1. item`` or ``2) item``.
+
+    Args:
+        line: A stripped, non-empty line of text.
+
+    Returns:
+        The item text without its number, or None if not a numbered item.
+    """
+    end = 0
+    while end < len(line) and line[end].isdecimal():
+        end += 1
+
+    if end and line[end : end + 1] in (".", ")") and line[end + 1 : end + 2].isspace():
+        return line[end + 2 :].lstrip()
+    return None
 
 
 class StructureExtractor:
@@ -60,6 +94,10 @@ class StructureExtractor:
         4: 1.15,  # H4: 1.15x - 1.3x
     }
 
+    # HEADING_RATIOS values in ascending order, for bisecting a font size
+    # ratio; ratios below the first threshold are not headings
+    _HEADING_THRESHOLDS = tuple(sorted(HEADING_RATIOS.values()))
+
     def __init__(self, pages: list[PageContent]) -> None:
         """Initialize the structure extractor.
 
@@ -76,15 +114,26 @@ class StructureExtractor:
             List of lists, where each inner list contains StructuredElement
             objects for one page.
         """
+        return list(self.iter_extract())
+
+    def iter_extract(self) -> Iterator[list[StructuredElement]]:
+        """Extract structural elements page by page.
+
+        The base font size is a whole-document statistic, so it is computed
+        up front; each page's elements are then yielded as soon as they are
+        classified.
+
+        Yields:
+            List of StructuredElement objects for each page, in order.
+        """
         # Calculate base font size across all pages
         self._base_font_size = self._calculate_base_font_size()
 
-        result: list[list[StructuredElement]] = []
-        for page in self.pages:
-            page_elements = self._extract_page_structure(page)
-            result.append(page_elements)
+        # Classify each distinct font size once for the whole document
+        heading_levels = self._classify_font_sizes(self._base_font_size)
 
-        return result
+        for page in self.pages:
+            yield self._extract_page_structure(page, heading_levels)
 
     def _calculate_base_font_size(self) -> float:
         """Calculate the base (most common) font size across all pages.
@@ -97,95 +146,107 @@ class StructureExtractor:
         for page in self.pages:
             for block in page.blocks:
                 if block.font_size is not None:
-                    font_sizes.append(block.font_size)
+                    font_sizes.append(round(block.font_size, 1))
 
         if not font_sizes:
             return 12.0
 
-        # Return the most common font size
-        return max(set(font_sizes), key=font_sizes.count)
+        # Return the most common font size. Ties go to the smaller size, so
+        # a document opening with a heading does not make it the body size.
+        counts = Counter(font_sizes)
+        return max(counts.items(), key=lambda item: (item[1], -item[0]))[0]
+
+    def _classify_font_sizes(
+        self, base_font_size: float
+    ) -> dict[float | None, int | None]:
+        """Compute the heading level of every distinct font size in the document.
 
-    def _extract_page_structure(self, page: PageContent) -> list[StructuredElement]:
+        Documents use only a handful of font sizes, so classifying each one
+        once replaces a ratio computation per block with a dict lookup.
+
+        Args:
+            base_font_size: The document's base font size.
+
+        Returns:
+            Mapping from block font size to heading level (or None).
+        """
+        font_sizes = {block.font_size for page in self.pages for block in page.blocks}
+        return {
+            font_size: self._detect_heading_level(font_size, base_font_size)
+            for font_size in font_sizes
+        }
+
+    def _extract_page_structure(
+        self,
+        page: PageContent,
+        heading_levels: dict[float | None, int | None],
+    ) -> list[StructuredElement]:
         """Extract structural elements from a single page.
 
         Args:
             page: The PageContent object to analyze.
+            heading_levels: Heading level for each font size in the document.
 
         Returns:
             List of StructuredElement objects for the page.
         """
-        elements: list[StructuredElement] = []
-
-        for block in page.blocks:
-            block_elements = self._analyze_block(block)
-            elements.extend(block_elements)
-
-        return elements
+        return list(
+            chain.from_iterable(
+                self._analyze_block(block, heading_levels[block.font_size])
+                for block in page.blocks
+            )
+        )
 
-    def _analyze_block(self, block: TextBlock) -> list[StructuredElement]:
+    def _analyze_block(
+        self, block: TextBlock, heading_level: int | None
+    ) -> Iterator[StructuredElement]:
         """Analyze a text block and determine its structural type.
 
         Args:
             block: The TextBlock to analyze.
+            heading_level: Heading level for the block's font size, or None.
+                All lines in a block share it.
 
-        Returns:
-            List of StructuredElement objects (may be multiple for multi-line blocks).
+        Yields:
+            StructuredElement objects (may be multiple for multi-line blocks).
         """
-        elements: list[StructuredElement] = []
-        text = block.text.strip()
-
-        if not text:
-            return elements
-
-        # Split block into lines for list detection
-        lines = text.split("\n")
-
-        for line in lines:
+        # Classify line by line for list detection
+        for line in block.lines:
             line = line.strip()
             if not line:
                 continue
 
-            element = self._classify_line(line, block.font_size)
-            if element:
-                elements.append(element)
+            yield self._classify_line(line, heading_level)
 
-        return elements
-
-    def _classify_line(
-        self, line: str, font_size: float | None
-    ) -> StructuredElement | None:
+    def _classify_line(self, line: str, heading_level: int | None) -> StructuredElement:
         """Classify a single line of text.
 
         Args:
-            line: The text line to classify.
-            font_size: The font size of the line (if known).
+            line: The stripped, non-empty text line to classify.
+            heading_level: Heading level of the enclosing block, or None.
 
         Returns:
-            StructuredElement for the line, or None if empty.
+            StructuredElement for the line.
         """
-        if not line.strip():
-            return None
-
         # Check for bullet list
-        bullet_match = BULLET_PATTERN.match(line)
-        if bullet_match:
+        bullet_text = _match_bullet(line)
+        if bullet_text is not None:
             return StructuredElement(
                 element_type=ElementType.BULLET_LIST_ITEM,
-                text=bullet_match.group(1).strip(),
+                text=bullet_text,
                 level=1,
             )
 
         # Check for numbered list
-        numbered_match = NUMBERED_PATTERN.match(line)
-        if numbered_match:
+        numbered_text = _match_numbered(line)
+        if numbered_text is not None:
             return StructuredElement(
                 element_type=ElementType.NUMBERED_LIST_ITEM,
-                text=numbered_match.group(2).strip(),
+                text=numbered_text,
                 level=1,
             )
 
         # Check for heading based on font size
-        heading_level = self._detect_heading_level(font_size)
         if heading_level:
             element_type = self._get_heading_type(heading_level)
             return StructuredElement(
@@ -201,34 +262,28 @@ class StructureExtractor:
             level=0,
         )
 
-    def _detect_heading_level(self, font_size: float | None) -> int | None:
+    def _detect_heading_level(
+        self, font_size: float | None, base_font_size: float | None
+    ) -> int | None:
         """Detect heading level based on font size ratio.
 
         Args:
             font_size: The font size to check.
+            base_font_size: The document's base font size.
 
         Returns:
             Heading level (1-6) or None if not a heading.
         """
-        if font_size is None or self._base_font_size is None:
-            return None
-
-        if self._base_font_size == 0:
+        if font_size is None or not base_font_size:
             return None
 
-        ratio = font_size / self._base_font_size
+        ratio = font_size / base_font_size
 
-        # Check heading levels from largest to smallest
-        if ratio >= self.HEADING_RATIOS[1]:
-            return 1
-        elif ratio >= self.HEADING_RATIOS[2]:
-            return 2
-        elif ratio >= self.HEADING_RATIOS[3]:
-            return 3
-        elif ratio >= self.HEADING_RATIOS[4]:
-            return 4
-
-        return None
+        # Number of thresholds the ratio reaches: all of them is H1, one is H4
+        reached = bisect_right(self._HEADING_THRESHOLDS, ratio)
+        if not reached:
+            return None
+        return len(self._HEADING_THRESHOLDS) + 1 - reached
 
     def _get_heading_type(self, level: int) -> ElementType:
         """Get the ElementType for a heading level.
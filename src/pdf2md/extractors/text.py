@@ -4,30 +4,50 @@ This module provides utilities to extract text content from PDF files,
 preserving position and font information for structure detection.
 """
 
+import mmap
+import os
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AbstractContextManager, ExitStack, contextmanager, nullcontext
 from dataclasses import dataclass, field
 from pathlib import Path
 
 import fitz  # pymupdf
 
+# Documents with more pages than this are extracted in worker processes;
+# below it the pool start-up cost outweighs the per-page savings. pymupdf
+# holds the GIL while extracting, so threads cannot help here.
+PROCESS_PAGE_THRESHOLD = 500
 
-@dataclass
+# Files at least this large (in bytes) are memory-mapped instead of read
+# through buffered file I/O.
+MMAP_SIZE_THRESHOLD = 8 * 1024 * 1024
+
+
+@dataclass(slots=True)
 class TextBlock:
     """Represents a block of text extracted from a PDF page.
 
     Attributes:
-        text: The text content of the block.
+        lines: The text lines of the block, in reading order.
         bbox: Bounding box coordinates (x0, y0, x1, y1).
         font_size: The primary font size used in the block.
         font_name: The primary font name used in the block.
     """
 
-    text: str
+    lines: list[str]
     bbox: tuple[float, float, float, float]
     font_size: float | None = None
     font_name: str | None = None
 
+    @property
+    def text(self) -> str:
+        """Return the block's lines joined with newlines."""
+        return "\n".join(self.lines)
+
 
-@dataclass
+@dataclass(slots=True)
 class PageContent:
     """Represents the extracted content from a single PDF page.
 
@@ -56,13 +76,31 @@ class TextExtractor:
     preserving text position, font size, and reading order.
     """
 
-    def __init__(self, path: str | Path) -> None:
+    def __init__(
+        self,
+        path: str | Path,
+        parallel: bool = True,
+        detailed: bool = True,
+        doc: fitz.Document | None = None,
+    ) -> None:
         """Initialize the text extractor.
 
         Args:
             path: Path to the PDF file.
+            parallel: If True, extract large documents in worker processes.
+            detailed: If True, collect per-span font information needed for
+                heading detection. If False, use pymupdf's much cheaper flat
+                "blocks" output and leave font_size/font_name unset.
+            doc: An already-open document for ``path``, such as the one
+                returned by validation. Serial extraction reads its pages
+                instead of reopening the file; for parallel extraction only
+                its page count is read, and workers open the file themselves.
+                It is left open for the caller to close.
         """
         self.path = Path(path) if isinstance(path, str) else path
+        self.parallel = parallel
+        self.detailed = detailed
+        self.doc = doc
 
     def extract(self) -> list[PageContent]:
         """Extract text content from all pages of the PDF.
@@ -70,17 +108,63 @@ class TextExtractor:
         Returns:
             List of PageContent objects, one for each page.
         """
-        pages: list[PageContent] = []
+        return list(self.iter_pages())
 
-        doc = fitz.open(str(self.path))
-        try:
-            for page_num, page in enumerate(doc, start=1):
-                page_content = self._extract_page(page, page_num)
-                pages.append(page_content)
-        finally:
-            doc.close()
+    def iter_pages(self) -> Iterator[PageContent]:
+        """Extract text content page by page.
+
+        Pages are yielded in order as they are extracted, so callers that
+        process one page at a time never hold pymupdf page objects for the
+        whole document.
+
+        Yields:
+            PageContent objects, one for each page.
+        """
+        # A single worker only adds pool overhead to serial extraction
+        workers = _available_cpus()
+        with self._open() as doc:
+            page_count = doc.page_count
+            if not (
+                self.parallel and workers > 1 and page_count > PROCESS_PAGE_THRESHOLD
+            ):
+                for page_num, page in enumerate(doc, start=1):
+                    yield self._extract_page(page, page_num)
+                return
+
+        # Workers open their own handles, so the document is closed first
+        yield from self._iter_with_processes(page_count, workers)
+
+    def _open(self) -> AbstractContextManager[fitz.Document]:
+        """Return the caller's document, or open the file if none was given."""
+        if self.doc is not None:
+            return nullcontext(self.doc)
+        return _open_document(self.path)
+
+    def _iter_with_processes(
+        self, page_count: int, workers: int
+    ) -> Iterator[PageContent]:
+        """Extract all pages using a pool of worker processes.
+
+        Each worker opens the document once and extracts the pages it is
+        handed; ``map`` keeps the results in page order.
+
+        Args:
+            page_count: Number of pages in the document.
+            workers: Number of worker processes to start.
+
+        Yields:
+            PageContent objects, one for each page.
+        """
+        chunksize = max(1, page_count // (4 * workers))
 
-        return pages
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(str(self.path), self.detailed),
+        ) as executor:
+            yield from executor.map(
+                _extract_page_worker, range(page_count), chunksize=chunksize
+            )
 
     def _extract_page(self, page: fitz.Page, page_num: int) -> PageContent:
         """Extract content from a single page.
@@ -99,6 +183,16 @@ class TextExtractor:
             height=rect.height,
         )
 
+        if not self.detailed:
+            # Flat tuples: (x0, y0, x1, y1, text, block_no, block_type)
+            for x0, y0, x1, y1, text, _, block_type in page.get_text(
+                "blocks", flags=fitz.TEXT_PRESERVE_WHITESPACE
+            ):
+                lines = [line for line in text.split("\n") if line]
+                if block_type == 0 and lines:  # Text block (not image)
+                    page_content.blocks.append(TextBlock(lines, (x0, y0, x1, y1)))
+            return page_content
+
         # Extract text with detailed information using "dict" option
         text_dict = page.get_text("dict", flags=fitz.TEXT_PRESERVE_WHITESPACE)
 
@@ -131,35 +225,116 @@ class TextExtractor:
         font_names: list[str] = []
 
         for line in block.get("lines", []):
-            line_text_parts: list[str] = []
-            for span in line.get("spans", []):
-                span_text = span.get("text", "")
-                if span_text:
-                    line_text_parts.append(span_text)
-                    if "size" in span:
-                        font_sizes.append(span["size"])
-                    if "font" in span:
-                        font_names.append(span["font"])
-
-            if line_text_parts:
-                lines_text.append("".join(line_text_parts))
+            spans = [span for span in line.get("spans", []) if span.get("text")]
+            if not spans:
+                continue
+
+            lines_text.append("".join([span["text"] for span in spans]))
+            # Round so float noise does not split a single mode
+            font_sizes.extend(
+                [round(span["size"], 1) for span in spans if "size" in span]
+            )
+            font_names.extend([span["font"] for span in spans if "font" in span])
 
         if not lines_text:
             return None
 
-        # Determine primary font size (most common or average)
+        # Determine primary font size (most common)
         primary_font_size = None
         if font_sizes:
-            primary_font_size = max(set(font_sizes), key=font_sizes.count)
+            primary_font_size = Counter(font_sizes).most_common(1)[0][0]
 
         # Determine primary font name
         primary_font_name = None
         if font_names:
-            primary_font_name = max(set(font_names), key=font_names.count)
+            primary_font_name = Counter(font_names).most_common(1)[0][0]
 
         return TextBlock(
-            text="\n".join(lines_text),
+            lines=lines_text,
             bbox=tuple(bbox),  # type: ignore[arg-type]
             font_size=primary_font_size,
             font_name=primary_font_name,
         )
+
+
+def _available_cpus() -> int:
+    """Return the number of CPUs this process is allowed to run on.
+
+    The scheduler affinity mask reflects container and taskset CPU limits,
+    which os.cpu_count() ignores; it is not available on every platform.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+@contextmanager
+def _open_document(path: Path) -> Iterator[fitz.Document]:
+    """Open a PDF document, memory-mapping large files.
+
+    Large files are handed to pymupdf as a zero-copy view of an mmap, so
+    the OS page cache serves reads instead of a heap-allocated buffer.
+
+    Args:
+        path: Path to the PDF file.
+
+    Yields:
+        The open pymupdf document; it is closed on exit.
+    """
+    if path.stat().st_size < MMAP_SIZE_THRESHOLD:
+        doc = fitz.open(str(path))
+        try:
+            yield doc
+        finally:
+            doc.close()
+        return
+
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # The view must outlive the document and be released before unmapping
+    view = memoryview(mapped)
+    try:
+        doc = fitz.open(stream=view, filetype="pdf")
+        try:
+            yield doc
+        finally:
+            doc.close()
+    finally:
+        view.release()
+        mapped.close()
+
+
+# Per-process state for parallel extraction: the extractor and its open document.
+_worker_state: tuple[TextExtractor, fitz.Document] | None = None
+
+# Keeps a worker's document, and its memory map for large files, open until
+# the worker process exits.
+_worker_resources = ExitStack()
+
+
+def _init_worker(path_str: str, detailed: bool) -> None:
+    """Open the PDF once in a worker process, memory-mapping large files.
+
+    Args:
+        path_str: Path to the PDF file.
+        detailed: Whether to collect per-span font information.
+    """
+    global _worker_state
+    extractor = TextExtractor(path_str, parallel=False, detailed=detailed)
+    doc = _worker_resources.enter_context(_open_document(extractor.path))
+    _worker_state = (extractor, doc)
+
+
+def _extract_page_worker(page_index: int) -> PageContent:
+    """Extract a single page in a worker process.
+
+    Args:
+        page_index: The 0-indexed page number.
+
+    Returns:
+        PageContent object for the page.
+    """
+    assert _worker_state is not None, "worker not initialized"
+    extractor, doc = _worker_state
+    return extractor._extract_page(doc.load_page(page_index), page_index + 1)
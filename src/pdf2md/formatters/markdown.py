@@ -4,8 +4,20 @@ This module provides utilities to convert structured elements extracted
 from PDF documents into properly formatted Markdown text.
 """
 
+import io
+from collections.abc import Callable, Iterable
+from functools import partial
+from typing import TextIO
+
 from pdf2md.extractors.structure import ElementType, StructuredElement
 
+# Formats an element given the current numbered list counter
+_ElementFormatter = Callable[[StructuredElement, int], str]
+
+# Precomputed prefixes for the first numbered list items; longer lists fall
+# back to formatting the number
+_NUM_PREFIX = tuple(f"{i}. " for i in range(1, 257))
+
 
 class MarkdownFormatter:
     """Converts structured elements to Markdown format.
@@ -24,42 +36,87 @@ class MarkdownFormatter:
         ElementType.HEADING6: "######",
     }
 
-    def __init__(self, pages: list[list[StructuredElement]]) -> None:
+    def __init__(self, pages: Iterable[list[StructuredElement]]) -> None:
         """Initialize the markdown formatter.
 
         Args:
-            pages: List of pages, where each page is a list of StructuredElement.
+            pages: Pages to format, where each page is a list of
+                StructuredElement. May be a one-shot iterator, in which case
+                the formatter can only be used once.
         """
         self.pages = pages
 
+        # Dispatch table from element type to its formatting function, so
+        # each element costs a single lookup. Heading prefixes are bound
+        # with their trailing space already appended.
+        self._formatters: dict[ElementType, _ElementFormatter] = {
+            element_type: partial(self._format_heading, f"{prefix} ")
+            for element_type, prefix in self.HEADING_PREFIXES.items()
+        }
+        self._formatters[ElementType.BULLET_LIST_ITEM] = self._format_bullet
+        self._formatters[ElementType.NUMBERED_LIST_ITEM] = self._format_numbered
+        self._formatters[ElementType.PARAGRAPH] = self._format_text
+
     def format(self) -> str:
         """Format all pages as Markdown.
 
         Returns:
             Complete Markdown document as a string.
         """
-        formatted_pages: list[str] = []
+        buffer = io.StringIO()
+        self.write(buffer)
+        return buffer.getvalue()
+
+    def write(self, output: TextIO) -> None:
+        """Format all pages as Markdown and write them to a text stream.
+
+        Elements are written directly to the stream as they are formatted,
+        so neither per-page strings nor the complete document are built in
+        memory.
+
+        Args:
+            output: Writable text stream, such as an open output file.
+        """
+        first = True
 
         for page_elements in self.pages:
-            page_content = self._format_page(page_elements)
-            if page_content.strip():
-                formatted_pages.append(page_content)
+            if self._is_blank_page(page_elements):
+                continue
 
-        return "\n\n".join(formatted_pages)
+            if not first:
+                output.write("\n\n")
+            self._format_page_into(page_elements, output)
+            first = False
 
-    def _format_page(self, elements: list[StructuredElement]) -> str:
-        """Format a single page of elements.
+    def _is_blank_page(self, elements: list[StructuredElement]) -> bool:
+        """Check whether a page would format to whitespace only.
+
+        Headings and list items always carry their Markdown marker, so only
+        a page made up entirely of blank plain text elements is blank.
 
         Args:
             elements: List of StructuredElement objects for the page.
 
         Returns:
-            Formatted Markdown string for the page.
+            True if the page should be left out of the output.
         """
-        if not elements:
-            return ""
+        return all(
+            element.element_type not in self.HEADING_PREFIXES
+            and element.element_type != ElementType.BULLET_LIST_ITEM
+            and element.element_type != ElementType.NUMBERED_LIST_ITEM
+            and not element.text.strip()
+            for element in elements
+        )
+
+    def _format_page_into(
+        self, elements: list[StructuredElement], output: TextIO
+    ) -> None:
+        """Format a single page of elements into a text stream.
 
-        lines: list[str] = []
+        Args:
+            elements: Non-empty list of StructuredElement objects for the page.
+            output: Writable text stream to write the formatted page to.
+        """
         numbered_list_counter = 0
         prev_element_type: ElementType | None = None
 
@@ -68,31 +125,24 @@ class MarkdownFormatter:
             if element.element_type != ElementType.NUMBERED_LIST_ITEM:
                 numbered_list_counter = 0
 
-            # Add blank line before headings (if not first element)
-            if (
-                element.element_type in self.HEADING_PREFIXES
-                and prev_element_type is not None
-            ):
-                lines.append("")
-
-            # Add blank line after headings
-            if prev_element_type in self.HEADING_PREFIXES:
-                # Don't add if we already have one from above
-                if lines and lines[-1] != "":
-                    lines.append("")
+            if prev_element_type is not None:
+                output.write("\n")
+                # Add blank line before and after headings
+                if (
+                    element.element_type in self.HEADING_PREFIXES
+                    or prev_element_type in self.HEADING_PREFIXES
+                ):
+                    output.write("\n")
 
             # Format the element
-            formatted_line = self._format_element(element, numbered_list_counter)
+            output.write(self._format_element(element, numbered_list_counter))
 
             # Update numbered list counter
             if element.element_type == ElementType.NUMBERED_LIST_ITEM:
                 numbered_list_counter += 1
 
-            lines.append(formatted_line)
             prev_element_type = element.element_type
 
-        return "\n".join(lines)
-
     def _format_element(
         self, element: StructuredElement, numbered_list_counter: int
     ) -> str:
@@ -105,22 +155,29 @@ class MarkdownFormatter:
         Returns:
             Formatted Markdown string for the element.
         """
-        element_type = element.element_type
-        text = element.text
+        formatter = self._formatters.get(element.element_type, self._format_text)
+        return formatter(element, numbered_list_counter)
 
-        # Handle headings
-        if element_type in self.HEADING_PREFIXES:
-            prefix = self.HEADING_PREFIXES[element_type]
-            return f"{prefix} {text}"
-
-        # Handle bullet lists
-        if element_type == ElementType.BULLET_LIST_ITEM:
-            return f"- {text}"
-
-        # Handle numbered lists
-        if element_type == ElementType.NUMBERED_LIST_ITEM:
-            number = numbered_list_counter + 1
-            return f"{number}. {text}"
-
-        # Handle paragraphs and other text
-        return text
+    @staticmethod
+    def _format_heading(
+        prefix: str, element: StructuredElement, _numbered_list_counter: int
+    ) -> str:
+        """Format a heading with its Markdown prefix, including the space."""
+        return prefix + element.text
+
+    @staticmethod
+    def _format_bullet(element: StructuredElement, _numbered_list_counter: int) -> str:
+        """Format a bullet list item."""
+        return "- " + element.text
+
+    @staticmethod
+    def _format_numbered(element: StructuredElement, numbered_list_counter: int) -> str:
+        """Format a numbered list item with its position in the list."""
+        if numbered_list_counter < len(_NUM_PREFIX):
+            return _NUM_PREFIX[numbered_list_counter] + element.text
+        return f"{numbered_list_counter + 1}. {element.text}"
+
+    @staticmethod
+    def _format_text(element: StructuredElement, _numbered_list_counter: int) -> str:
+        """Format paragraphs and other text as-is."""
+        return element.text
@@ -3,10 +3,19 @@
 This package provides validation and helper utilities.
 """
 
+from pdf2md.utils.cache import ConversionCache, default_cache_dir
 from pdf2md.utils.validation import (
     ValidationError,
+    open_input_file,
     validate_input_file,
     validate_output_path,
 )
 
-__all__ = ["validate_input_file", "validate_output_path", "ValidationError"]
+__all__ = [
+    "validate_input_file",
+    "open_input_file",
+    "validate_output_path",
+    "ValidationError",
+    "ConversionCache",
+    "default_cache_dir",
+]
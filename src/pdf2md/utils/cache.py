@@ -0,0 +1,94 @@
+"""On-disk cache of converted Markdown for repeat conversions.
+
+This module provides a cache keyed by the SHA-256 digest of the input PDF
+and the pdf2md version, so an unchanged PDF can be converted again by
+copying the previous output instead of re-running the pipeline.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from pdf2md import __version__
+
+
+def default_cache_dir() -> Path:
+    """Return the default cache directory.
+
+    Returns:
+        ``$XDG_CACHE_HOME/pdf2md`` if XDG_CACHE_HOME is set, otherwise
+        ``~/.cache/pdf2md``.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "pdf2md"
+
+
+class ConversionCache:
+    """Stores converted Markdown keyed by input content and tool version."""
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding cached Markdown files. Created on
+                first store.
+        """
+        self.directory = Path(directory) if isinstance(directory, str) else directory
+
+    def key_for(self, pdf_path: Path) -> str:
+        """Compute the cache key for a PDF file.
+
+        Args:
+            pdf_path: Path to the input PDF file.
+
+        Returns:
+            Cache key combining the file's SHA-256 digest and the pdf2md version.
+        """
+        with pdf_path.open("rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+        return f"{digest}-{__version__}"
+
+    def lookup(self, key: str, pdf_path: Path) -> Path | None:
+        """Find the cached Markdown for a key.
+
+        Args:
+            key: Cache key from key_for.
+            pdf_path: Path to the input PDF file; entries older than it are
+                ignored.
+
+        Returns:
+            Path to the cached Markdown file, or None on a miss.
+        """
+        entry = self._entry_path(key)
+        try:
+            if entry.stat().st_mtime >= pdf_path.stat().st_mtime:
+                return entry
+        except OSError:
+            pass
+        return None
+
+    def store(self, key: str, markdown_path: Path) -> None:
+        """Store a converted Markdown file under a key.
+
+        The entry is written to a temporary file and renamed into place, so
+        concurrent readers never see a partial entry.
+
+        Args:
+            key: Cache key from key_for.
+            markdown_path: Path to the converted Markdown file.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copyfile(markdown_path, tmp_name)
+            os.replace(tmp_name, self._entry_path(key))
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _entry_path(self, key: str) -> Path:
+        """Return the file path for a cache key."""
+        return self.directory / f"{key}.md"
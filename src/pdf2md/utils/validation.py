@@ -34,6 +34,26 @@ def validate_input_file(path: str | Path) -> None:
     Args:
         path: Path to the input PDF file.
 
+    Raises:
+        ValidationError: If the file is not found (exit_code=1),
+            not a valid PDF (exit_code=2), or password-protected (exit_code=3).
+    """
+    open_input_file(path).close()
+
+
+def open_input_file(path: str | Path) -> fitz.Document:
+    """Validate the input file and return it as an open PDF document.
+
+    This performs the same checks as validate_input_file, but hands the
+    opened document to the caller so the PDF does not have to be parsed a
+    second time for extraction.
+
+    Args:
+        path: Path to the input PDF file.
+
+    Returns:
+        The open pymupdf document. The caller is responsible for closing it.
+
     Raises:
         ValidationError: If the file is not found (exit_code=1),
             not a valid PDF (exit_code=2), or password-protected (exit_code=3).
@@ -79,7 +99,7 @@ def validate_input_file(path: str | Path) -> None:
         # If we can't check encryption, assume it's okay
         pass
 
-    doc.close()
+    return doc
 
 
 def validate_output_path(
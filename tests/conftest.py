@@ -1,155 +1,150 @@
 """Pytest configuration and fixtures for pdf2md tests."""
 
-import tempfile
-from collections.abc import Generator
+import functools
+from collections.abc import Callable
 from pathlib import Path
 
-import fitz  # pymupdf
 import pytest
 
+from pdf2md.extractors.text import PageContent, TextExtractor
 
-@pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+# Pre-built PDFs read by the fixtures; regenerate them with
+# scripts/gen_test_pdfs.py after changing their content
+DATA_DIR = Path(__file__).parent / "data"
 
+# Contents of the plain-text input fixtures
+_NON_PDF_BYTES = b"This is not a PDF file, just plain text."
+_TXT_BYTES = b"This is a text file, not a PDF."
 
-@pytest.fixture
-def sample_pdf(temp_dir: Path) -> Path:
-    """Create a simple PDF file for testing."""
-    pdf_path = temp_dir / "sample.pdf"
-    doc = fitz.open()
-
-    # Add a page with some text
-    page = doc.new_page()
-    text_point = fitz.Point(72, 72)
-    page.insert_text(text_point, "Hello, World!", fontsize=12)
-    page.insert_text(fitz.Point(72, 100), "This is a test PDF document.", fontsize=12)
-
-    doc.save(str(pdf_path))
-    doc.close()
-    return pdf_path
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """Point the default conversion cache at a per-test directory."""
+    cache_home = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home / "pdf2md"
 
 
 @pytest.fixture
-def multi_page_pdf(temp_dir: Path) -> Path:
-    """Create a multi-page PDF file for testing."""
-    pdf_path = temp_dir / "multi_page.pdf"
-    doc = fitz.open()
-
-    for i in range(3):
-        page = doc.new_page()
-        page.insert_text(fitz.Point(72, 72), f"Page {i + 1} content", fontsize=12)
-        page.insert_text(fitz.Point(72, 100), f"More text on page {i + 1}.", fontsize=12)
-
-    doc.save(str(pdf_path))
-    doc.close()
-    return pdf_path
+def temp_dir(tmp_path: Path) -> Path:
+    """Create a temporary directory for test files.
 
+    Cleanup is left to pytest's temporary directory retention policy.
+    """
+    return tmp_path
 
-@pytest.fixture
-def pdf_with_headings(temp_dir: Path) -> Path:
-    """Create a PDF with different font sizes for heading detection."""
-    pdf_path = temp_dir / "headings.pdf"
-    doc = fitz.open()
-    page = doc.new_page()
 
-    # Title - largest font
-    page.insert_text(fitz.Point(72, 72), "Document Title", fontsize=24)
+@pytest.fixture(scope="session")
+def pdf_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a directory for input files shared by the whole session.
 
-    # Heading 1
-    page.insert_text(fitz.Point(72, 120), "Chapter One", fontsize=18)
+    Input files are only ever read by tests, so each one is built once per
+    session. Tests that write files should use temp_dir instead.
+    """
+    return tmp_path_factory.mktemp("pdfs")
 
-    # Regular paragraph
-    page.insert_text(fitz.Point(72, 150), "This is regular paragraph text.", fontsize=12)
 
-    # Heading 2
-    page.insert_text(fitz.Point(72, 180), "Section 1.1", fontsize=14)
+@pytest.fixture(scope="session")
+def sample_pdf() -> Path:
+    """Return a simple PDF file for testing."""
+    return DATA_DIR / "sample.pdf"
 
-    # More paragraph text
-    page.insert_text(fitz.Point(72, 210), "Another paragraph here.", fontsize=12)
 
-    doc.save(str(pdf_path))
-    doc.close()
-    return pdf_path
+@pytest.fixture(scope="session")
+def multi_page_pdf() -> Path:
+    """Return a multi-page PDF file for testing."""
+    return DATA_DIR / "multi_page.pdf"
 
 
-@pytest.fixture
-def pdf_with_lists(temp_dir: Path) -> Path:
-    """Create a PDF with bullet and numbered lists."""
-    pdf_path = temp_dir / "lists.pdf"
-    doc = fitz.open()
-    page = doc.new_page()
-
-    y_pos = 72
-
-    # Regular text
-    page.insert_text(fitz.Point(72, y_pos), "Here is a bullet list:", fontsize=12)
-    y_pos += 20
-
-    # Bullet list
-    bullets = ["- First item", "- Second item", "- Third item"]
-    for bullet in bullets:
-        page.insert_text(fitz.Point(72, y_pos), bullet, fontsize=12)
-        y_pos += 18
-
-    y_pos += 10
-    page.insert_text(fitz.Point(72, y_pos), "Here is a numbered list:", fontsize=12)
-    y_pos += 20
-
-    # Numbered list
-    numbers = ["1. First numbered item", "2. Second numbered item", "3. Third numbered item"]
-    for num in numbers:
-        page.insert_text(fitz.Point(72, y_pos), num, fontsize=12)
-        y_pos += 18
-
-    doc.save(str(pdf_path))
-    doc.close()
-    return pdf_path
+@pytest.fixture(scope="session")
+def large_pdf() -> Path:
+    """Return a PDF long enough to trigger parallel extraction."""
+    return DATA_DIR / "large.pdf"
 
 
-@pytest.fixture
-def password_protected_pdf(temp_dir: Path) -> Path:
-    """Create a password-protected PDF file."""
-    pdf_path = temp_dir / "protected.pdf"
-    doc = fitz.open()
-    page = doc.new_page()
-    page.insert_text(fitz.Point(72, 72), "Secret content", fontsize=12)
-
-    # Save with encryption
-    doc.save(
-        str(pdf_path),
-        encryption=fitz.PDF_ENCRYPT_AES_256,
-        user_pw="user123",
-        owner_pw="owner456",
-    )
-    doc.close()
-    return pdf_path
+@pytest.fixture(scope="session")
+def pdf_with_headings() -> Path:
+    """Return a PDF with different font sizes for heading detection."""
+    return DATA_DIR / "headings.pdf"
 
 
-@pytest.fixture
-def empty_pdf(temp_dir: Path) -> Path:
-    """Create an empty PDF file (no pages)."""
-    pdf_path = temp_dir / "empty.pdf"
-    doc = fitz.open()
-    doc.new_page()  # Add one blank page
-    doc.save(str(pdf_path))
-    doc.close()
-    return pdf_path
+@pytest.fixture(scope="session")
+def pdf_with_lists() -> Path:
+    """Return a PDF with bullet and numbered lists."""
+    return DATA_DIR / "lists.pdf"
 
 
-@pytest.fixture
-def non_pdf_file(temp_dir: Path) -> Path:
+@pytest.fixture(scope="session")
+def password_protected_pdf() -> Path:
+    """Return a password-protected PDF file."""
+    return DATA_DIR / "protected.pdf"
+
+
+@pytest.fixture(scope="session")
+def empty_pdf() -> Path:
+    """Return an empty PDF file (one blank page)."""
+    return DATA_DIR / "empty.pdf"
+
+
+@functools.cache
+def _extract_cached(path_str: str) -> list[PageContent]:
+    """Extract a fixture PDF once per process.
+
+    Callers must treat the returned pages as read-only, since they are
+    shared by every test that extracts the same file.
+    """
+    return TextExtractor(path_str).extract()
+
+
+@pytest.fixture(scope="session")
+def extract() -> Callable[[Path], list[PageContent]]:
+    """Return a function extracting the pages of a read-only fixture PDF."""
+    return lambda pdf_path: _extract_cached(str(pdf_path))
+
+
+@pytest.fixture(scope="session")
+def sample_pages(sample_pdf: Path) -> list[PageContent]:
+    """Extract the pages of sample_pdf once for the whole session."""
+    return _extract_cached(str(sample_pdf))
+
+
+@pytest.fixture(scope="session")
+def multi_pages(multi_page_pdf: Path) -> list[PageContent]:
+    """Extract the pages of multi_page_pdf once for the whole session."""
+    return _extract_cached(str(multi_page_pdf))
+
+
+@pytest.fixture(scope="session")
+def headings_pages(pdf_with_headings: Path) -> list[PageContent]:
+    """Extract the pages of pdf_with_headings once for the whole session."""
+    return _extract_cached(str(pdf_with_headings))
+
+
+@pytest.fixture(scope="session")
+def lists_pages(pdf_with_lists: Path) -> list[PageContent]:
+    """Extract the pages of pdf_with_lists once for the whole session."""
+    return _extract_cached(str(pdf_with_lists))
+
+
+@pytest.fixture(scope="session")
+def empty_pages(empty_pdf: Path) -> list[PageContent]:
+    """Extract the pages of empty_pdf once for the whole session."""
+    return _extract_cached(str(empty_pdf))
+
+
+@pytest.fixture(scope="session")
+def non_pdf_file(pdf_dir: Path) -> Path:
     """Create a non-PDF file with .pdf extension."""
-    pdf_path = temp_dir / "not_a_pdf.pdf"
-    pdf_path.write_text("This is not a PDF file, just plain text.")
+    pdf_path = pdf_dir / "not_a_pdf.pdf"
+    pdf_path.write_bytes(_NON_PDF_BYTES)
     return pdf_path
 
 
-@pytest.fixture
-def text_file(temp_dir: Path) -> Path:
+@pytest.fixture(scope="session")
+def text_file(pdf_dir: Path) -> Path:
     """Create a plain text file."""
-    txt_path = temp_dir / "document.txt"
-    txt_path.write_text("This is a text file, not a PDF.")
+    txt_path = pdf_dir / "document.txt"
+    txt_path.write_bytes(_TXT_BYTES)
     return txt_path
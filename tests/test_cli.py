@@ -3,14 +3,18 @@
 TDD RED Phase: These tests define the expected behavior of the CLI.
 """
 
+import shutil
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from pdf2md import __version__
 from pdf2md.cli import app
+from pdf2md.extractors.text import PageContent, TextExtractor
 
-runner = CliRunner()
+# Plain output; stderr is already captured separately from stdout
+runner = CliRunner(env={"NO_COLOR": "1", "TERM": "dumb"})
 
 
 class TestCLI:
@@ -31,57 +35,45 @@ class TestCLI:
         assert "pdf2md" in result.stdout.lower() or "PDF" in result.stdout
         assert "INPUT_FILE" in result.stdout or "input" in result.stdout.lower()
 
-    def test_convert_simple_pdf(self, sample_pdf: Path, temp_dir: Path) -> None:
-        """Should convert PDF to Markdown via CLI."""
-        output_path = temp_dir / "output.md"
-
-        result = runner.invoke(app, [str(sample_pdf), str(output_path)])
-
-        assert result.exit_code == 0
-        assert output_path.exists()
-        content = output_path.read_text()
-        assert "Hello" in content
-
-    def test_convert_with_default_output(self, sample_pdf: Path) -> None:
-        """Should use default output path (input.md) when not specified."""
-        expected_output = sample_pdf.with_suffix(".md")
-
-        try:
-            result = runner.invoke(app, [str(sample_pdf)])
-
-            assert result.exit_code == 0
-            assert expected_output.exists()
-        finally:
-            # Cleanup
-            if expected_output.exists():
-                expected_output.unlink()
-
-    def test_convert_nonexistent_file(self, temp_dir: Path) -> None:
-        """Should exit with code 1 for non-existent file."""
-        result = runner.invoke(
-            app, [str(temp_dir / "nonexistent.pdf"), str(temp_dir / "output.md")]
+    @pytest.mark.parametrize(
+        ("input_fixture", "exit_code"),
+        [
+            ("sample_pdf", 0),
+            (None, 1),
+            ("non_pdf_file", 2),
+            ("password_protected_pdf", 3),
+        ],
+    )
+    def test_convert_exit_codes(
+        self,
+        request: pytest.FixtureRequest,
+        temp_dir: Path,
+        input_fixture: str | None,
+        exit_code: int,
+    ) -> None:
+        """Should exit with the conversion's exit code."""
+        input_path = (
+            request.getfixturevalue(input_fixture)
+            if input_fixture is not None
+            else temp_dir / "nonexistent.pdf"
         )
 
-        assert result.exit_code == 1
-        # The exit code is the main check; error messages may go to stderr
-        # which typer's CliRunner may not capture in result.output
+        result = runner.invoke(app, [str(input_path), str(temp_dir / "output.md")])
 
-    def test_convert_invalid_pdf(self, non_pdf_file: Path, temp_dir: Path) -> None:
-        """Should exit with code 2 for invalid PDF."""
-        result = runner.invoke(app, [str(non_pdf_file), str(temp_dir / "output.md")])
+        assert result.exit_code == exit_code
+        assert (temp_dir / "output.md").exists() is (exit_code == 0)
 
-        assert result.exit_code == 2
-
-    def test_convert_password_protected_pdf(
-        self, password_protected_pdf: Path, temp_dir: Path
+    def test_convert_with_default_output(
+        self, sample_pdf: Path, temp_dir: Path
     ) -> None:
-        """Should exit with code 3 for password-protected PDF."""
-        result = runner.invoke(
-            app, [str(password_protected_pdf), str(temp_dir / "output.md")]
-        )
+        """Should use default output path (input.md) when not specified."""
+        # Convert a copy so the output is not written next to the shared PDF
+        pdf_copy = shutil.copy(sample_pdf, temp_dir / "sample.pdf")
+
+        result = runner.invoke(app, [str(pdf_copy)])
 
-        assert result.exit_code == 3
-        # The exit code is the main check; error messages may go to stderr
+        assert result.exit_code == 0
+        assert (temp_dir / "sample.md").exists()
 
     def test_convert_with_force_flag(self, sample_pdf: Path, temp_dir: Path) -> None:
         """Should overwrite existing file with --force flag."""
@@ -128,6 +120,108 @@ class TestCLI:
         # Quiet should minimize output
         # (may still have minimal output, but should succeed)
 
+    def test_conversion_is_cached(
+        self, sample_pdf: Path, temp_dir: Path, isolated_cache_dir: Path
+    ) -> None:
+        """Should store conversions in the cache by default."""
+        result = runner.invoke(app, [str(sample_pdf), str(temp_dir / "output.md")])
+
+        assert result.exit_code == 0
+        assert len(list(isolated_cache_dir.glob("*.md"))) == 1
+
+    def test_no_cache_flag(
+        self, sample_pdf: Path, temp_dir: Path, isolated_cache_dir: Path
+    ) -> None:
+        """Should bypass the cache with --no-cache."""
+        result = runner.invoke(
+            app, [str(sample_pdf), str(temp_dir / "output.md"), "--no-cache"]
+        )
+
+        assert result.exit_code == 0
+        assert not isolated_cache_dir.exists()
+
+    def test_no_headings_flag(self, pdf_with_headings: Path, temp_dir: Path) -> None:
+        """Should output headings as plain paragraphs with --no-headings."""
+        output_path = temp_dir / "output.md"
+
+        result = runner.invoke(
+            app, [str(pdf_with_headings), str(output_path), "--no-headings"]
+        )
+
+        assert result.exit_code == 0
+        assert "#" not in output_path.read_text()
+
+
+class TestCLIBatch:
+    """Tests for converting a directory of PDF files."""
+
+    def test_convert_directory(
+        self, sample_pdf: Path, multi_page_pdf: Path, temp_dir: Path
+    ) -> None:
+        """Should convert every PDF in a directory next to its input."""
+        shutil.copy(sample_pdf, temp_dir)
+        shutil.copy(multi_page_pdf, temp_dir)
+
+        result = runner.invoke(app, [str(temp_dir), "--jobs", "2"])
+
+        assert result.exit_code == 0
+        assert "Hello" in (temp_dir / "sample.md").read_text()
+        assert "Page 3 content" in (temp_dir / "multi_page.md").read_text()
+
+    def test_convert_directory_to_output_directory(
+        self, sample_pdf: Path, multi_page_pdf: Path, temp_dir: Path
+    ) -> None:
+        """Should write to the output directory when one is given."""
+        shutil.copy(sample_pdf, temp_dir)
+        shutil.copy(multi_page_pdf, temp_dir)
+        output_dir = temp_dir / "out"
+        output_dir.mkdir()
+
+        result = runner.invoke(app, [str(temp_dir), str(output_dir), "-j", "1"])
+
+        assert result.exit_code == 0
+        assert sorted(path.name for path in output_dir.iterdir()) == [
+            "multi_page.md",
+            "sample.md",
+        ]
+
+    def test_convert_directory_exits_with_worst_code(
+        self, sample_pdf: Path, non_pdf_file: Path, temp_dir: Path
+    ) -> None:
+        """Should convert the valid files and exit with the failure's code."""
+        shutil.copy(sample_pdf, temp_dir)
+        shutil.copy(non_pdf_file, temp_dir)
+
+        result = runner.invoke(app, [str(temp_dir), "--jobs", "2"])
+
+        assert result.exit_code == 2
+        assert (temp_dir / "sample.md").exists()
+        assert not (temp_dir / "not_a_pdf.md").exists()
+
+    def test_convert_directory_extracts_files_serially(
+        self, sample_pdf: Path, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Batch workers should not start nested extraction pools."""
+        shutil.copy(sample_pdf, temp_dir)
+        parallel_flags: list[bool] = []
+        extract = TextExtractor.extract
+
+        def record(self: TextExtractor) -> list[PageContent]:
+            parallel_flags.append(self.parallel)
+            return extract(self)
+
+        monkeypatch.setattr(TextExtractor, "extract", record)
+        result = runner.invoke(app, [str(temp_dir), "-j", "1"])
+
+        assert result.exit_code == 0
+        assert parallel_flags == [False]
+
+    def test_convert_directory_without_pdfs(self, temp_dir: Path) -> None:
+        """Should exit with code 1 when the directory has no PDF files."""
+        result = runner.invoke(app, [str(temp_dir)])
+
+        assert result.exit_code == 1
+
 
 class TestCLIShortFlags:
     """Tests for CLI short flags."""
@@ -157,16 +251,3 @@ class TestCLIShortFlags:
 
         assert result.exit_code == 0
 
-
-class TestCLIEdgeCases:
-    """Edge case tests for CLI."""
-
-    def test_output_to_nonexistent_directory(
-        self, sample_pdf: Path, temp_dir: Path
-    ) -> None:
-        """Should exit with code 4 for non-existent output directory."""
-        result = runner.invoke(
-            app, [str(sample_pdf), str(temp_dir / "nonexistent" / "output.md")]
-        )
-
-        assert result.exit_code == 4
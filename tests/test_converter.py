@@ -5,9 +5,23 @@ TDD RED Phase: These tests define the expected behavior of the converter.
 
 from pathlib import Path
 
+import pytest
+
 from pdf2md.converter import ConversionResult, PDFToMarkdownConverter
 
 
+class _LockedDocument:
+    """Stand-in for an encrypted document that needs a password."""
+
+    is_encrypted = True
+
+    def authenticate(self, _password: str) -> int:
+        return 0
+
+    def close(self) -> None:
+        pass
+
+
 class TestPDFToMarkdownConverter:
     """Tests for PDFToMarkdownConverter class."""
 
@@ -92,12 +106,17 @@ class TestPDFToMarkdownConverter:
         assert result.exit_code == 2
 
     def test_convert_password_protected_pdf_returns_error(
-        self, password_protected_pdf: Path, temp_dir: Path
+        self, sample_pdf: Path, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Should return error result for password-protected PDF."""
+        # Real encrypted PDFs are covered by the validation tests
+        monkeypatch.setattr(
+            "pdf2md.utils.validation.fitz.open",
+            lambda *_args, **_kwargs: _LockedDocument(),
+        )
         output_path = temp_dir / "output.md"
 
-        converter = PDFToMarkdownConverter(password_protected_pdf, output_path)
+        converter = PDFToMarkdownConverter(sample_pdf, output_path)
         result = converter.convert()
 
         assert result.success is False
@@ -143,8 +162,9 @@ class TestPDFToMarkdownConverter:
 
         assert result.success is True
         # Original content should be replaced
-        assert output_path.read_text() != "Existing content"
-        assert "Hello" in output_path.read_text()
+        content = output_path.read_text()
+        assert content != "Existing content"
+        assert "Hello" in content
 
     def test_convert_accepts_string_paths(
         self, sample_pdf: Path, temp_dir: Path
@@ -157,6 +177,138 @@ class TestPDFToMarkdownConverter:
 
         assert result.success is True
 
+    def test_convert_writes_lf_line_endings(
+        self, multi_page_pdf: Path, temp_dir: Path
+    ) -> None:
+        """Should write UTF-8 Markdown with LF line endings."""
+        output_path = temp_dir / "output.md"
+
+        result = PDFToMarkdownConverter(multi_page_pdf, output_path).convert()
+
+        assert result.success is True
+        data = output_path.read_bytes()
+        assert b"\n" in data
+        assert b"\r\n" not in data
+
+    def test_convert_reuses_cached_output(
+        self, sample_pdf: Path, temp_dir: Path
+    ) -> None:
+        """A second conversion of the same PDF should be served from the cache."""
+        cache_dir = temp_dir / "cache"
+        first_output = temp_dir / "first.md"
+        second_output = temp_dir / "second.md"
+
+        first = PDFToMarkdownConverter(
+            sample_pdf, first_output, cache_dir=cache_dir
+        ).convert()
+        second = PDFToMarkdownConverter(
+            sample_pdf, second_output, cache_dir=cache_dir
+        ).convert()
+
+        assert first.success is True
+        assert first.from_cache is False
+        assert second.success is True
+        assert second.from_cache is True
+        assert second.pages_converted == 1
+        assert second_output.read_text() == first_output.read_text()
+
+    def test_convert_without_heading_detection(
+        self, pdf_with_headings: Path, temp_dir: Path
+    ) -> None:
+        """Should output headings as plain paragraphs when detection is off."""
+        output_path = temp_dir / "output.md"
+
+        result = PDFToMarkdownConverter(
+            pdf_with_headings, output_path, detect_headings=False
+        ).convert()
+
+        assert result.success is True
+        content = output_path.read_text()
+        assert "Document Title" in content
+        assert "#" not in content
+
+    def test_convert_caches_heading_modes_separately(
+        self, pdf_with_headings: Path, temp_dir: Path
+    ) -> None:
+        """Output without headings should not be served for a full conversion."""
+        cache_dir = temp_dir / "cache"
+
+        PDFToMarkdownConverter(
+            pdf_with_headings,
+            temp_dir / "plain.md",
+            cache_dir=cache_dir,
+            detect_headings=False,
+        ).convert()
+        result = PDFToMarkdownConverter(
+            pdf_with_headings, temp_dir / "full.md", cache_dir=cache_dir
+        ).convert()
+
+        assert result.from_cache is False
+        assert "# Document Title" in (temp_dir / "full.md").read_text()
+
+    def test_convert_without_cache_dir_does_not_cache(
+        self, sample_pdf: Path, temp_dir: Path
+    ) -> None:
+        """Caching should be disabled unless a cache directory is given."""
+        PDFToMarkdownConverter(sample_pdf, temp_dir / "first.md").convert()
+        result = PDFToMarkdownConverter(sample_pdf, temp_dir / "second.md").convert()
+
+        assert result.success is True
+        assert result.from_cache is False
+
+    def test_convert_failure_removes_partial_output(
+        self, sample_pdf: Path, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should not leave a partially written file when formatting fails."""
+        output_path = temp_dir / "output.md"
+
+        def fail(*_args: object) -> None:
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(
+            "pdf2md.extractors.structure.StructureExtractor._extract_page_structure",
+            fail,
+        )
+        result = PDFToMarkdownConverter(sample_pdf, output_path).convert()
+
+        assert result.success is False
+        assert result.exit_code == 5
+        assert "boom" in result.error_message
+        assert not output_path.exists()
+        assert list(temp_dir.iterdir()) == []
+
+    def test_convert_failure_keeps_existing_output(
+        self, sample_pdf: Path, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A failed forced conversion should leave the existing file intact."""
+        output_path = temp_dir / "existing.md"
+        output_path.write_text("Existing content")
+
+        def fail(*_args: object) -> None:
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(
+            "pdf2md.extractors.structure.StructureExtractor._extract_page_structure",
+            fail,
+        )
+        result = PDFToMarkdownConverter(sample_pdf, output_path, force=True).convert()
+
+        assert result.success is False
+        assert output_path.read_text() == "Existing content"
+        assert list(temp_dir.iterdir()) == [output_path]
+
+    def test_convert_output_uses_default_permissions(
+        self, sample_pdf: Path, temp_dir: Path
+    ) -> None:
+        """The output file should not keep the temporary file's private mode."""
+        output_path = temp_dir / "output.md"
+        reference = temp_dir / "reference.md"
+        reference.write_text("")
+
+        PDFToMarkdownConverter(sample_pdf, output_path).convert()
+
+        assert output_path.stat().st_mode == reference.stat().st_mode
+
 
 class TestConversionResult:
     """Tests for ConversionResult data class."""
@@ -3,26 +3,24 @@
 TDD RED Phase: These tests define the expected behavior of the structure extractor.
 """
 
-from pathlib import Path
+import pytest
 
 from pdf2md.extractors.structure import (
     ElementType,
     StructuredElement,
     StructureExtractor,
 )
-from pdf2md.extractors.text import TextExtractor
+from pdf2md.extractors.text import PageContent, TextBlock
 
 
 class TestStructureExtractor:
     """Tests for StructureExtractor class."""
 
-    def test_detects_heading_by_large_font_size(self, pdf_with_headings: Path) -> None:
+    def test_detects_heading_by_large_font_size(
+        self, headings_pages: list[PageContent]
+    ) -> None:
         """Should detect headings based on larger font sizes."""
-        text_extractor = TextExtractor(pdf_with_headings)
-        pages = text_extractor.extract()
-
-        structure_extractor = StructureExtractor(pages)
-        result = structure_extractor.extract()
+        result = StructureExtractor(headings_pages).extract()
 
         # Should have one page of results
         assert len(result) == 1
@@ -39,13 +37,11 @@ class TestStructureExtractor:
         title_found = any("Document Title" in elem.text for elem in headings)
         assert title_found, "Document Title should be detected as a heading"
 
-    def test_detects_multiple_heading_levels(self, pdf_with_headings: Path) -> None:
+    def test_detects_multiple_heading_levels(
+        self, headings_pages: list[PageContent]
+    ) -> None:
         """Should detect different heading levels based on font size ratios."""
-        text_extractor = TextExtractor(pdf_with_headings)
-        pages = text_extractor.extract()
-
-        structure_extractor = StructureExtractor(pages)
-        result = structure_extractor.extract()
+        result = StructureExtractor(headings_pages).extract()
 
         # Get all heading types
         heading_types = {elem.element_type for elem in result[0]}
@@ -62,13 +58,9 @@ class TestStructureExtractor:
         detected_headings = heading_types & heading_element_types
         assert len(detected_headings) >= 2, "Should detect multiple heading levels"
 
-    def test_detects_paragraph_text(self, pdf_with_headings: Path) -> None:
+    def test_detects_paragraph_text(self, headings_pages: list[PageContent]) -> None:
         """Should detect regular text as paragraphs."""
-        text_extractor = TextExtractor(pdf_with_headings)
-        pages = text_extractor.extract()
-
-        structure_extractor = StructureExtractor(pages)
-        result = structure_extractor.extract()
+        result = StructureExtractor(headings_pages).extract()
 
         # Find paragraphs
         paragraphs = [
@@ -80,13 +72,9 @@ class TestStructureExtractor:
         para_found = any("paragraph" in elem.text.lower() for elem in paragraphs)
         assert para_found, "Paragraph text should be detected"
 
-    def test_detects_bullet_list_items(self, pdf_with_lists: Path) -> None:
+    def test_detects_bullet_list_items(self, lists_pages: list[PageContent]) -> None:
         """Should detect bullet list items (-, *, +)."""
-        text_extractor = TextExtractor(pdf_with_lists)
-        pages = text_extractor.extract()
-
-        structure_extractor = StructureExtractor(pages)
-        result = structure_extractor.extract()
+        result = StructureExtractor(lists_pages).extract()
 
         # Find bullet list items
         bullets = [
@@ -100,13 +88,9 @@ class TestStructureExtractor:
         first_items_text = " ".join(b.text for b in bullets[:3])
         assert "First" in first_items_text or "item" in first_items_text.lower()
 
-    def test_detects_numbered_list_items(self, pdf_with_lists: Path) -> None:
+    def test_detects_numbered_list_items(self, lists_pages: list[PageContent]) -> None:
         """Should detect numbered list items (1., 2., etc.)."""
-        text_extractor = TextExtractor(pdf_with_lists)
-        pages = text_extractor.extract()
-
-        structure_extractor = StructureExtractor(pages)
-        result = structure_extractor.extract()
+        result = StructureExtractor(lists_pages).extract()
 
         # Find numbered list items
         numbered = [
@@ -116,26 +100,18 @@ class TestStructureExtractor:
         ]
         assert len(numbered) >= 3, "Should detect at least 3 numbered items"
 
-    def test_preserves_text_content(self, sample_pdf: Path) -> None:
+    def test_preserves_text_content(self, sample_pages: list[PageContent]) -> None:
         """Should preserve the original text content."""
-        text_extractor = TextExtractor(sample_pdf)
-        pages = text_extractor.extract()
-
-        structure_extractor = StructureExtractor(pages)
-        result = structure_extractor.extract()
+        result = StructureExtractor(sample_pages).extract()
 
         # All text should be preserved
         all_text = " ".join(elem.text for elem in result[0])
         assert "Hello" in all_text
         assert "World" in all_text
 
-    def test_handles_empty_page(self, empty_pdf: Path) -> None:
+    def test_handles_empty_page(self, empty_pages: list[PageContent]) -> None:
         """Should handle empty pages gracefully."""
-        text_extractor = TextExtractor(empty_pdf)
-        pages = text_extractor.extract()
-
-        structure_extractor = StructureExtractor(pages)
-        result = structure_extractor.extract()
+        result = StructureExtractor(empty_pages).extract()
 
         # Should return an empty list for the page
         assert len(result) == 1
@@ -143,17 +119,86 @@ class TestStructureExtractor:
             elem.text.strip() == "" for elem in result[0]
         )
 
-    def test_handles_multi_page_document(self, multi_page_pdf: Path) -> None:
+    def test_handles_multi_page_document(self, multi_pages: list[PageContent]) -> None:
         """Should process all pages of a multi-page document."""
-        text_extractor = TextExtractor(multi_page_pdf)
-        pages = text_extractor.extract()
-
-        structure_extractor = StructureExtractor(pages)
-        result = structure_extractor.extract()
+        result = StructureExtractor(multi_pages).extract()
 
         # Should have 3 pages of results
         assert len(result) == 3
 
+    def test_iter_extract_yields_pages_in_order(
+        self, multi_pages: list[PageContent]
+    ) -> None:
+        """iter_extract should yield the same pages as extract, one at a time."""
+        streamed = list(StructureExtractor(multi_pages).iter_extract())
+
+        assert streamed == StructureExtractor(multi_pages).extract()
+        assert "Page 2" in streamed[1][0].text
+
+    def test_list_markers_require_following_space(self) -> None:
+        """Lines that merely start with a marker character stay paragraphs."""
+        block = TextBlock(
+            lines=[
+                "-dash prefix",
+                "2024 was a year",
+                "1.5 million",
+                "- Real item",
+                "2) Step",
+            ],
+            bbox=(0, 0, 100, 100),
+            font_size=12.0,
+        )
+        result = StructureExtractor([PageContent(1, [block])]).extract()
+
+        assert [elem.element_type for elem in result[0]] == [
+            ElementType.PARAGRAPH,
+            ElementType.PARAGRAPH,
+            ElementType.PARAGRAPH,
+            ElementType.BULLET_LIST_ITEM,
+            ElementType.NUMBERED_LIST_ITEM,
+        ]
+        assert result[0][3].text == "Real item"
+        assert result[0][4].text == "Step"
+
+    def test_heading_levels_follow_size_thresholds(self) -> None:
+        """Each heading level starts exactly at its font size ratio."""
+        blocks = [
+            TextBlock(lines=[f"Size {size}"], bbox=(0, 0, 100, 100), font_size=size)
+            for size in (10.0, 10.0, 10.0, 11.4, 11.5, 13.0, 15.0, 18.0, 30.0)
+        ]
+        result = StructureExtractor([PageContent(1, blocks)]).extract()
+
+        assert [elem.element_type for elem in result[0]] == [
+            ElementType.PARAGRAPH,
+            ElementType.PARAGRAPH,
+            ElementType.PARAGRAPH,
+            ElementType.PARAGRAPH,
+            ElementType.HEADING4,
+            ElementType.HEADING3,
+            ElementType.HEADING2,
+            ElementType.HEADING1,
+            ElementType.HEADING1,
+        ]
+
+    def test_base_font_size_ties_prefer_smaller_size(self) -> None:
+        """A heading size tied with the body size should not become the base."""
+        pages = [
+            PageContent(
+                i,
+                [
+                    TextBlock([f"Chapter {i}"], (0, 0, 100, 20), font_size=24.0),
+                    TextBlock([f"Body {i}"], (0, 30, 100, 50), font_size=12.0),
+                ],
+            )
+            for i in range(1, 4)
+        ]
+        result = StructureExtractor(pages).extract()
+
+        assert [elem.element_type for elem in result[0]] == [
+            ElementType.HEADING1,
+            ElementType.PARAGRAPH,
+        ]
+
 
 class TestStructuredElement:
     """Tests for StructuredElement data class."""
@@ -183,24 +228,31 @@ class TestStructuredElement:
         )
         assert element.level == 1
 
+    def test_structured_element_uses_slots(self) -> None:
+        """StructuredElement should not carry a per-instance __dict__."""
+        element = StructuredElement(ElementType.PARAGRAPH, "Test text")
+        assert not hasattr(element, "__dict__")
+
 
 class TestElementType:
     """Tests for ElementType enum."""
 
     def test_heading_types_exist(self) -> None:
         """Should have heading types 1-6."""
-        assert ElementType.HEADING1.value == "heading1"
-        assert ElementType.HEADING2.value == "heading2"
-        assert ElementType.HEADING3.value == "heading3"
-        assert ElementType.HEADING4.value == "heading4"
-        assert ElementType.HEADING5.value == "heading5"
-        assert ElementType.HEADING6.value == "heading6"
-
-    def test_paragraph_type_exists(self) -> None:
-        """Should have paragraph type."""
-        assert ElementType.PARAGRAPH.value == "paragraph"
-
-    def test_list_types_exist(self) -> None:
-        """Should have bullet and numbered list item types."""
-        assert ElementType.BULLET_LIST_ITEM.value == "bullet_list_item"
-        assert ElementType.NUMBERED_LIST_ITEM.value == "numbered_list_item"
+        assert {
+            element_type.value
+            for element_type in ElementType
+            if element_type.name.startswith("HEADING")
+        } == {"heading1", "heading2", "heading3", "heading4", "heading5", "heading6"}
+
+    @pytest.mark.parametrize(
+        ("name", "value"),
+        [
+            ("PARAGRAPH", "paragraph"),
+            ("BULLET_LIST_ITEM", "bullet_list_item"),
+            ("NUMBERED_LIST_ITEM", "numbered_list_item"),
+        ],
+    )
+    def test_element_type_values(self, name: str, value: str) -> None:
+        """Should have paragraph and list item types."""
+        assert ElementType[name].value == value
@@ -3,45 +3,57 @@
 TDD RED Phase: These tests define the expected behavior of the text extractor.
 """
 
+from collections.abc import Callable
+from contextlib import AbstractContextManager, ExitStack
 from pathlib import Path
 
+import fitz  # pymupdf
+import pytest
+
+from pdf2md.extractors import text as text_module
 from pdf2md.extractors.text import PageContent, TextExtractor
 
+ExtractFn = Callable[[Path], list[PageContent]]
+
 
 class TestTextExtractor:
     """Tests for TextExtractor class."""
 
-    def test_extract_text_from_single_page_pdf(self, sample_pdf: Path) -> None:
+    def test_extract_text_from_single_page_pdf(
+        self, sample_pdf: Path, extract: ExtractFn
+    ) -> None:
         """Should extract text from a single-page PDF."""
-        extractor = TextExtractor(sample_pdf)
-        pages = extractor.extract()
+        pages = extract(sample_pdf)
 
         assert len(pages) == 1
         assert isinstance(pages[0], PageContent)
         assert "Hello" in pages[0].text
         assert "World" in pages[0].text
 
-    def test_extract_text_from_multi_page_pdf(self, multi_page_pdf: Path) -> None:
+    def test_extract_text_from_multi_page_pdf(
+        self, multi_page_pdf: Path, extract: ExtractFn
+    ) -> None:
         """Should extract text from all pages of a multi-page PDF."""
-        extractor = TextExtractor(multi_page_pdf)
-        pages = extractor.extract()
+        pages = extract(multi_page_pdf)
 
         assert len(pages) == 3
         for i, page in enumerate(pages):
             assert f"Page {i + 1}" in page.text
             assert page.page_number == i + 1
 
-    def test_page_content_has_page_number(self, sample_pdf: Path) -> None:
+    def test_page_content_has_page_number(
+        self, sample_pdf: Path, extract: ExtractFn
+    ) -> None:
         """PageContent should include the page number (1-indexed)."""
-        extractor = TextExtractor(sample_pdf)
-        pages = extractor.extract()
+        pages = extract(sample_pdf)
 
         assert pages[0].page_number == 1
 
-    def test_page_content_has_text_blocks(self, sample_pdf: Path) -> None:
+    def test_page_content_has_text_blocks(
+        self, sample_pdf: Path, extract: ExtractFn
+    ) -> None:
         """PageContent should include text blocks with position info."""
-        extractor = TextExtractor(sample_pdf)
-        pages = extractor.extract()
+        pages = extract(sample_pdf)
 
         assert len(pages[0].blocks) > 0
         # Each block should have text and position info
@@ -49,10 +61,11 @@ class TestTextExtractor:
             assert hasattr(block, "text")
             assert hasattr(block, "bbox")
 
-    def test_empty_pdf_returns_empty_page(self, empty_pdf: Path) -> None:
+    def test_empty_pdf_returns_empty_page(
+        self, empty_pdf: Path, extract: ExtractFn
+    ) -> None:
         """An empty PDF page should return PageContent with empty or minimal text."""
-        extractor = TextExtractor(empty_pdf)
-        pages = extractor.extract()
+        pages = extract(empty_pdf)
 
         assert len(pages) == 1
         # Empty page should have empty or whitespace-only text
@@ -72,10 +85,11 @@ class TestTextExtractor:
 
         assert len(pages) >= 1
 
-    def test_extract_preserves_text_order(self, multi_page_pdf: Path) -> None:
+    def test_extract_preserves_text_order(
+        self, multi_page_pdf: Path, extract: ExtractFn
+    ) -> None:
         """Text extraction should preserve reading order."""
-        extractor = TextExtractor(multi_page_pdf)
-        pages = extractor.extract()
+        pages = extract(multi_page_pdf)
 
         # Each page should have content appearing in reading order
         for page in pages:
@@ -84,22 +98,132 @@ class TestTextExtractor:
             more_idx = page.text.find("More")
             assert content_idx < more_idx
 
+    def test_process_extraction_matches_serial(
+        self, large_pdf: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Process-based extraction should return the same pages, in order."""
+        monkeypatch.setattr(text_module, "PROCESS_PAGE_THRESHOLD", 0)
+        monkeypatch.setattr(text_module, "_available_cpus", lambda: 2)
+
+        process_pages = TextExtractor(large_pdf).extract()
+        serial_pages = TextExtractor(large_pdf, parallel=False).extract()
+
+        assert [p.page_number for p in process_pages] == list(range(1, 26))
+        assert [p.text for p in process_pages] == [p.text for p in serial_pages]
+
+    def test_worker_opens_memory_mapped_document(
+        self, multi_page_pdf: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Worker processes should open large files through the memory map."""
+        opened: list[Path] = []
+        open_document = text_module._open_document
+
+        def spy(path: Path) -> AbstractContextManager[fitz.Document]:
+            opened.append(path)
+            return open_document(path)
+
+        resources = ExitStack()
+        monkeypatch.setattr(text_module, "MMAP_SIZE_THRESHOLD", 0)
+        monkeypatch.setattr(text_module, "_open_document", spy)
+        monkeypatch.setattr(text_module, "_worker_resources", resources)
+        monkeypatch.setattr(text_module, "_worker_state", None)
+        with resources:
+            text_module._init_worker(str(multi_page_pdf), True)
+            page = text_module._extract_page_worker(2)
+
+        assert opened == [multi_page_pdf]
+        assert "Page 3 content" in page.text
+
+    def test_parallel_extraction_counts_pages_with_provided_document(
+        self, large_pdf: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A provided document should spare the parent from reopening the file."""
+
+        def no_open(_path: Path) -> None:
+            raise AssertionError("document reopened")
+
+        def page_indexes(_self: TextExtractor, page_count: int, _workers: int) -> range:
+            return range(page_count)
+
+        monkeypatch.setattr(text_module, "PROCESS_PAGE_THRESHOLD", 0)
+        monkeypatch.setattr(text_module, "_available_cpus", lambda: 2)
+        monkeypatch.setattr(TextExtractor, "_iter_with_processes", page_indexes)
+        monkeypatch.setattr(text_module, "_open_document", no_open)
+        doc = fitz.open(str(large_pdf))
+        try:
+            # The pool is stubbed to yield page indexes for the counted pages
+            pages = list(TextExtractor(large_pdf, doc=doc).iter_pages())
+
+            assert pages == list(range(25))
+            assert not doc.is_closed
+        finally:
+            doc.close()
+
+    def test_single_cpu_extracts_serially(
+        self, large_pdf: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """With one CPU available, no worker pool should be started."""
+
+        def no_pool(*_args: object, **_kwargs: object) -> None:
+            raise AssertionError("worker pool started")
+
+        monkeypatch.setattr(text_module, "PROCESS_PAGE_THRESHOLD", 0)
+        monkeypatch.setattr(text_module, "_available_cpus", lambda: 1)
+        monkeypatch.setattr(text_module, "ProcessPoolExecutor", no_pool)
+
+        pages = TextExtractor(large_pdf).extract()
+
+        assert [p.page_number for p in pages] == list(range(1, 26))
+
+    def test_fast_extraction_matches_detailed_text(
+        self, pdf_with_headings: Path
+    ) -> None:
+        """detailed=False should extract the same text without font info."""
+        fast_pages = TextExtractor(pdf_with_headings, detailed=False).extract()
+        detailed_pages = TextExtractor(pdf_with_headings).extract()
+
+        assert [p.text for p in fast_pages] == [p.text for p in detailed_pages]
+        assert all(block.font_size is None for block in fast_pages[0].blocks)
+
+    def test_memory_mapped_extraction_matches(
+        self, multi_page_pdf: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Memory-mapped files should extract the same text."""
+        regular_pages = TextExtractor(multi_page_pdf).extract()
+        monkeypatch.setattr(text_module, "MMAP_SIZE_THRESHOLD", 0)
+        mapped_pages = TextExtractor(multi_page_pdf).extract()
+
+        assert [p.text for p in mapped_pages] == [p.text for p in regular_pages]
+
+    def test_extractor_uses_provided_document(self, multi_page_pdf: Path) -> None:
+        """An already-open document should be used and left open."""
+        doc = fitz.open(str(multi_page_pdf))
+        try:
+            pages = TextExtractor(multi_page_pdf, doc=doc).extract()
+
+            assert len(pages) == 3
+            assert not doc.is_closed
+        finally:
+            doc.close()
+
 
 class TestPageContent:
     """Tests for PageContent data class."""
 
-    def test_page_content_text_property(self, sample_pdf: Path) -> None:
+    def test_page_content_text_property(
+        self, sample_pdf: Path, extract: ExtractFn
+    ) -> None:
         """PageContent.text should return combined text from all blocks."""
-        extractor = TextExtractor(sample_pdf)
-        pages = extractor.extract()
+        pages = extract(sample_pdf)
 
         assert isinstance(pages[0].text, str)
         assert len(pages[0].text) > 0
 
-    def test_page_content_blocks_property(self, sample_pdf: Path) -> None:
+    def test_page_content_blocks_property(
+        self, sample_pdf: Path, extract: ExtractFn
+    ) -> None:
         """PageContent.blocks should return list of TextBlock objects."""
-        extractor = TextExtractor(sample_pdf)
-        pages = extractor.extract()
+        pages = extract(sample_pdf)
 
         assert isinstance(pages[0].blocks, list)
 
@@ -107,10 +231,9 @@ class TestPageContent:
 class TestTextBlock:
     """Tests for TextBlock data class."""
 
-    def test_text_block_has_bbox(self, sample_pdf: Path) -> None:
+    def test_text_block_has_bbox(self, sample_pdf: Path, extract: ExtractFn) -> None:
         """TextBlock should have bounding box coordinates."""
-        extractor = TextExtractor(sample_pdf)
-        pages = extractor.extract()
+        pages = extract(sample_pdf)
 
         if pages[0].blocks:
             block = pages[0].blocks[0]
@@ -118,10 +241,11 @@ class TestTextBlock:
             assert len(block.bbox) == 4
             assert all(isinstance(coord, (int, float)) for coord in block.bbox)
 
-    def test_text_block_has_font_info(self, pdf_with_headings: Path) -> None:
+    def test_text_block_has_font_info(
+        self, pdf_with_headings: Path, extract: ExtractFn
+    ) -> None:
         """TextBlock should have font size information for structure detection."""
-        extractor = TextExtractor(pdf_with_headings)
-        pages = extractor.extract()
+        pages = extract(pdf_with_headings)
 
         # At least some blocks should have font_size
         has_font_size = any(
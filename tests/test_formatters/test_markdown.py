@@ -3,6 +3,9 @@
 TDD RED Phase: These tests define the expected behavior of the markdown formatter.
 """
 
+import io
+
+import pytest
 
 from pdf2md.extractors.structure import ElementType, StructuredElement
 from pdf2md.formatters.markdown import MarkdownFormatter
@@ -11,60 +14,25 @@ from pdf2md.formatters.markdown import MarkdownFormatter
 class TestMarkdownFormatter:
     """Tests for MarkdownFormatter class."""
 
-    def test_format_heading1(self) -> None:
-        """Should format H1 with single # prefix."""
-        elements = [
-            [
-                StructuredElement(
-                    element_type=ElementType.HEADING1,
-                    text="Main Title",
-                    level=1,
-                )
-            ]
-        ]
+    @pytest.mark.parametrize(
+        ("element_type", "level", "prefix"),
+        [
+            (ElementType.HEADING1, 1, "#"),
+            (ElementType.HEADING2, 2, "##"),
+            (ElementType.HEADING3, 3, "###"),
+            (ElementType.HEADING4, 4, "####"),
+            (ElementType.HEADING5, 5, "#####"),
+            (ElementType.HEADING6, 6, "######"),
+        ],
+    )
+    def test_format_heading(
+        self, element_type: ElementType, level: int, prefix: str
+    ) -> None:
+        """Should format each heading level with its # prefix."""
+        elements = [[StructuredElement(element_type, "Title", level)]]
         formatter = MarkdownFormatter(elements)
-        result = formatter.format()
-
-        assert "# Main Title" in result
-        assert "## Main Title" not in result
 
-    def test_format_heading2(self) -> None:
-        """Should format H2 with ## prefix."""
-        elements = [
-            [
-                StructuredElement(
-                    element_type=ElementType.HEADING2,
-                    text="Subtitle",
-                    level=2,
-                )
-            ]
-        ]
-        formatter = MarkdownFormatter(elements)
-        result = formatter.format()
-
-        assert "## Subtitle" in result
-
-    def test_format_all_heading_levels(self) -> None:
-        """Should format all heading levels correctly."""
-        elements = [
-            [
-                StructuredElement(ElementType.HEADING1, "H1", 1),
-                StructuredElement(ElementType.HEADING2, "H2", 2),
-                StructuredElement(ElementType.HEADING3, "H3", 3),
-                StructuredElement(ElementType.HEADING4, "H4", 4),
-                StructuredElement(ElementType.HEADING5, "H5", 5),
-                StructuredElement(ElementType.HEADING6, "H6", 6),
-            ]
-        ]
-        formatter = MarkdownFormatter(elements)
-        result = formatter.format()
-
-        assert "# H1" in result
-        assert "## H2" in result
-        assert "### H3" in result
-        assert "#### H4" in result
-        assert "##### H5" in result
-        assert "###### H6" in result
+        assert formatter.format() == f"{prefix} Title"
 
     def test_format_paragraph(self) -> None:
         """Should format paragraph without prefix."""
@@ -83,64 +51,35 @@ class TestMarkdownFormatter:
         assert "This is a regular paragraph." in result
         assert "#" not in result
 
-    def test_format_bullet_list(self) -> None:
-        """Should format bullet list items with - prefix."""
-        elements = [
-            [
-                StructuredElement(
-                    element_type=ElementType.BULLET_LIST_ITEM,
-                    text="First item",
-                    level=1,
-                ),
-                StructuredElement(
-                    element_type=ElementType.BULLET_LIST_ITEM,
-                    text="Second item",
-                    level=1,
-                ),
-                StructuredElement(
-                    element_type=ElementType.BULLET_LIST_ITEM,
-                    text="Third item",
-                    level=1,
-                ),
-            ]
-        ]
-        formatter = MarkdownFormatter(elements)
-        result = formatter.format()
-
-        assert "- First item" in result
-        assert "- Second item" in result
-        assert "- Third item" in result
-
-    def test_format_numbered_list(self) -> None:
-        """Should format numbered list items with sequential numbers."""
+    @pytest.mark.parametrize(
+        ("element_type", "expected"),
+        [
+            (
+                ElementType.BULLET_LIST_ITEM,
+                "- First item\n- Second item\n- Third item",
+            ),
+            (
+                ElementType.NUMBERED_LIST_ITEM,
+                "1. First item\n2. Second item\n3. Third item",
+            ),
+        ],
+    )
+    def test_format_list_items(self, element_type: ElementType, expected: str) -> None:
+        """Should prefix bullet items with - and number numbered items in order."""
         elements = [
             [
-                StructuredElement(
-                    element_type=ElementType.NUMBERED_LIST_ITEM,
-                    text="First step",
-                    level=1,
-                ),
-                StructuredElement(
-                    element_type=ElementType.NUMBERED_LIST_ITEM,
-                    text="Second step",
-                    level=1,
-                ),
-                StructuredElement(
-                    element_type=ElementType.NUMBERED_LIST_ITEM,
-                    text="Third step",
-                    level=1,
-                ),
+                StructuredElement(element_type, text, 1)
+                for text in ("First item", "Second item", "Third item")
             ]
         ]
         formatter = MarkdownFormatter(elements)
-        result = formatter.format()
 
-        assert "1. First step" in result
-        assert "2. Second step" in result
-        assert "3. Third step" in result
+        assert formatter.format() == expected
 
-    def test_format_mixed_content(self) -> None:
-        """Should correctly format mixed content types."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mixed_result(cls) -> str:
+        """Format a page of mixed content types once for the whole class."""
         elements = [
             [
                 StructuredElement(ElementType.HEADING1, "Document Title", 1),
@@ -151,15 +90,22 @@ class TestMarkdownFormatter:
                 StructuredElement(ElementType.PARAGRAPH, "Conclusion text.", 0),
             ]
         ]
-        formatter = MarkdownFormatter(elements)
-        result = formatter.format()
-
-        assert "# Document Title" in result
-        assert "Introduction paragraph." in result
-        assert "## Section 1" in result
-        assert "- Point A" in result
-        assert "- Point B" in result
-        assert "Conclusion text." in result
+        return MarkdownFormatter(elements).format()
+
+    @pytest.mark.parametrize(
+        "expected",
+        [
+            "# Document Title",
+            "Introduction paragraph.",
+            "## Section 1",
+            "- Point A",
+            "- Point B",
+            "Conclusion text.",
+        ],
+    )
+    def test_format_mixed_content(self, mixed_result: str, expected: str) -> None:
+        """Should correctly format mixed content types."""
+        assert expected in mixed_result
 
     def test_format_multi_page_document(self) -> None:
         """Should format multi-page documents with page separators."""
@@ -184,6 +130,18 @@ class TestMarkdownFormatter:
         # Should return empty or whitespace-only string
         assert result.strip() == ""
 
+    def test_format_skips_whitespace_only_pages(self) -> None:
+        """Pages that format to whitespace only should not add separators."""
+        elements = [
+            [StructuredElement(ElementType.PARAGRAPH, "A", 0)],
+            [StructuredElement(ElementType.PARAGRAPH, "", 0)],
+            [StructuredElement(ElementType.PARAGRAPH, "  ", 0)],
+            [StructuredElement(ElementType.PARAGRAPH, "B", 0)],
+        ]
+        result = MarkdownFormatter(elements).format()
+
+        assert result == "A\n\nB"
+
     def test_format_preserves_text_content(self) -> None:
         """Should preserve original text content."""
         original_text = "Special characters: <>&\"'"
@@ -229,12 +187,51 @@ class TestMarkdownFormatter:
 
         # First list should have 1., 2.
         # Second list should restart at 1.
-        lines = [line.strip() for line in result.split("\n") if line.strip()]
-        numbered_lines = [line for line in lines if line[0].isdigit()]
+        numbered_lines = [
+            line
+            for line in (raw.strip() for raw in result.split("\n"))
+            if line and line[0].isdigit()
+        ]
         assert len(numbered_lines) >= 4
         # Verify the second list starts at 1 again
         assert numbered_lines[2].startswith("1.")
 
+    def test_numbered_list_continues_past_precomputed_prefixes(self) -> None:
+        """Long numbered lists should keep counting beyond the prefix table."""
+        elements = [
+            [
+                StructuredElement(ElementType.NUMBERED_LIST_ITEM, f"Item {i}", 1)
+                for i in range(1, 301)
+            ]
+        ]
+        lines = MarkdownFormatter(elements).format().split("\n")
+
+        assert lines[0] == "1. Item 1"
+        assert lines[255] == "256. Item 256"
+        assert lines[256] == "257. Item 257"
+        assert lines[-1] == "300. Item 300"
+
+    def test_write_streams_to_text_stream(self) -> None:
+        """write() should produce the same output as format()."""
+        elements = [
+            [StructuredElement(ElementType.HEADING1, "Title", 1)],
+            [],
+            [StructuredElement(ElementType.PARAGRAPH, "Page 3 content", 0)],
+        ]
+        output = io.StringIO()
+        MarkdownFormatter(elements).write(output)
+
+        assert output.getvalue() == MarkdownFormatter(elements).format()
+        assert output.getvalue() == "# Title\n\nPage 3 content"
+
+    def test_format_accepts_iterator(self) -> None:
+        """Should accept a one-shot iterator of pages."""
+        elements = iter([[StructuredElement(ElementType.PARAGRAPH, "Streamed", 0)]])
+        formatter = MarkdownFormatter(elements)
+        result = formatter.format()
+
+        assert result == "Streamed"
+
 
 class TestMarkdownFormatterEdgeCases:
     """Edge case tests for MarkdownFormatter."""
@@ -246,7 +243,8 @@ class TestMarkdownFormatterEdgeCases:
         formatter = MarkdownFormatter(elements)
         result = formatter.format()
 
-        assert long_text in result
+        assert len(result) == len(long_text)
+        assert result == long_text
 
     def test_format_text_with_newlines(self) -> None:
         """Should handle text that already contains newlines."""
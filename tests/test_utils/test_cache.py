@@ -0,0 +1,76 @@
+"""Tests for the conversion cache."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from pdf2md import __version__
+from pdf2md.utils.cache import ConversionCache, default_cache_dir
+
+
+class TestDefaultCacheDir:
+    """Tests for default_cache_dir function."""
+
+    def test_uses_xdg_cache_home(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should live under XDG_CACHE_HOME when it is set."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(temp_dir))
+        assert default_cache_dir() == temp_dir / "pdf2md"
+
+    def test_falls_back_to_home(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should default to ~/.cache/pdf2md."""
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+        assert default_cache_dir() == Path.home() / ".cache" / "pdf2md"
+
+
+class TestConversionCache:
+    """Tests for ConversionCache class."""
+
+    def test_key_depends_on_content_and_version(
+        self, sample_pdf: Path, multi_page_pdf: Path, temp_dir: Path
+    ) -> None:
+        """Keys should differ for different content and include the version."""
+        cache = ConversionCache(temp_dir / "cache")
+
+        key = cache.key_for(sample_pdf)
+
+        assert key.endswith(f"-{__version__}")
+        assert key == cache.key_for(sample_pdf)
+        assert key != cache.key_for(multi_page_pdf)
+
+    def test_lookup_miss(self, sample_pdf: Path, temp_dir: Path) -> None:
+        """Should return None when nothing is cached."""
+        cache = ConversionCache(temp_dir / "cache")
+        assert cache.lookup(cache.key_for(sample_pdf), sample_pdf) is None
+
+    def test_store_then_lookup(self, sample_pdf: Path, temp_dir: Path) -> None:
+        """A stored entry should be found with the same content."""
+        cache = ConversionCache(temp_dir / "cache")
+        markdown_path = temp_dir / "output.md"
+        markdown_path.write_text("# Cached")
+        key = cache.key_for(sample_pdf)
+
+        cache.store(key, markdown_path)
+        entry = cache.lookup(key, sample_pdf)
+
+        assert entry is not None
+        assert entry.read_text() == "# Cached"
+        assert not list((temp_dir / "cache").glob("*.tmp"))
+
+    def test_lookup_ignores_entries_older_than_input(
+        self, sample_pdf: Path, temp_dir: Path
+    ) -> None:
+        """Entries older than the input file should be treated as misses."""
+        cache = ConversionCache(temp_dir / "cache")
+        markdown_path = temp_dir / "output.md"
+        markdown_path.write_text("# Cached")
+        key = cache.key_for(sample_pdf)
+        cache.store(key, markdown_path)
+
+        entry = temp_dir / "cache" / f"{key}.md"
+        input_mtime = sample_pdf.stat().st_mtime
+        os.utime(entry, (input_mtime - 10, input_mtime - 10))
+
+        assert cache.lookup(key, sample_pdf) is None
@@ -9,6 +9,7 @@ import pytest
 
 from pdf2md.utils.validation import (
     ValidationError,
+    open_input_file,
     validate_input_file,
     validate_output_path,
 )
@@ -70,6 +71,27 @@ class TestValidateInputFile:
         assert result is None
 
 
+class TestOpenInputFile:
+    """Tests for open_input_file function."""
+
+    def test_returns_open_document(self, multi_page_pdf: Path) -> None:
+        """A valid PDF should be returned as an open document."""
+        doc = open_input_file(multi_page_pdf)
+        try:
+            assert doc.page_count == 3
+            assert not doc.is_closed
+        finally:
+            doc.close()
+
+    def test_password_protected_pdf_raises_validation_error(
+        self, password_protected_pdf: Path
+    ) -> None:
+        """Should apply the same checks as validate_input_file."""
+        with pytest.raises(ValidationError) as exc_info:
+            open_input_file(password_protected_pdf)
+        assert exc_info.value.exit_code == 3
+
+
 class TestValidateOutputPath:
     """Tests for validate_output_path function."""
 
@@ -123,22 +145,25 @@ class TestValidateOutputPath:
 class TestValidationError:
     """Tests for ValidationError exception class."""
 
-    def test_validation_error_has_message(self) -> None:
-        """ValidationError should store the error message."""
-        error = ValidationError("Test error message", exit_code=1)
-        assert str(error) == "Test error message"
-
-    def test_validation_error_has_exit_code(self) -> None:
-        """ValidationError should store the exit code."""
-        error = ValidationError("Test error", exit_code=3)
-        assert error.exit_code == 3
-
-    def test_validation_error_default_exit_code(self) -> None:
-        """ValidationError should have a default exit code of 5 (unexpected error)."""
-        error = ValidationError("Test error")
-        assert error.exit_code == 5
+    @pytest.mark.parametrize(
+        ("message", "exit_code", "expected_exit_code"),
+        [
+            ("Test error message", 1, 1),
+            ("Test error", 3, 3),
+            # Default exit code is 5 (unexpected error)
+            ("Test error", None, 5),
+        ],
+    )
+    def test_validation_error_fields(
+        self, message: str, exit_code: int | None, expected_exit_code: int
+    ) -> None:
+        """ValidationError should be an Exception storing message and exit code."""
+        error = (
+            ValidationError(message)
+            if exit_code is None
+            else ValidationError(message, exit_code=exit_code)
+        )
 
-    def test_validation_error_is_exception(self) -> None:
-        """ValidationError should be an Exception subclass."""
-        error = ValidationError("Test", exit_code=1)
         assert isinstance(error, Exception)
+        assert str(error) == message
+        assert error.exit_code == expected_exit_code